@@ -3,6 +3,7 @@
 # safe shutdown, and SIZE-BASED LOG ROTATION (gzip + prune) inside main.py.
 
 import json, time, random, signal, importlib.util, traceback, gzip, shutil
+from collections import deque
 from pathlib import Path
 from types import ModuleType
 from typing import Dict, Any, List, Tuple
@@ -22,6 +23,11 @@ LOGROTATE_MAX_BYTES = 5 * 1024 * 1024   # rotate at ~5MB
 LOGROTATE_KEEP = 7                      # keep 7 rotated gz files
 LOGROTATE_CHECK_EVERY_TICKS = 60        # cheap stat every 60 ticks
 
+# --- State size knobs ---
+LAST_ACTIONS_KEEP = 25                  # recent (tick, action, reward) triples
+NOTES_KEEP = 256                        # skills append free-form notes every few ticks
+RECENT_ACTIONS_KEEP = 1024              # in-memory action ring handed to skills via ctx
+
 def now_ts() -> float:
     return time.time()
 
@@ -53,6 +59,8 @@ def load_state() -> Dict[str, Any]:
 def log_event(kind: str, payload: Dict[str, Any]) -> None:
     event = {"ts": now_ts(), "kind": kind, **payload}
     with LOG.open("a", encoding="utf-8") as f:
+        # Keep json.dumps' default separators: TICK_MARK in skills/_logtail.py matches
+        # b'"kind": "tick"' byte-for-byte to skip non-tick lines without parsing them.
         f.write(json.dumps(event, ensure_ascii=False) + "\n")
 
 def _rotate_logs_if_needed(state: Dict[str, Any]) -> None:
@@ -107,16 +115,36 @@ class Skill:
         self.name = name
         self.module = module
         self.act = act_fn  # callable(context) -> float|None
+        # Fixed-schedule skills (LOADER_GATED = True + RUN_EVERY) are only dispatched
+        # on due ticks; off-schedule picks score 0.0 without calling into the module.
+        every = getattr(module, "RUN_EVERY", None)
+        gated = getattr(module, "LOADER_GATED", False) is True
+        self.run_every = int(every) if gated and isinstance(every, int) and every > 1 else 0
+
+    def due(self, tick: int) -> bool:
+        # LOADER_GATED skills keep their own `ticks % RUN_EVERY` guard in act() as a
+        # safety net for anything that calls them without asking due() first.
+        return not self.run_every or tick % self.run_every == 0
+
+# Loaded skill modules keyed by path -> (mtime_ns, module). Unchanged files keep their
+# module object across rescans so in-process caches survive; edited files hot-reload.
+_LOADED: Dict[str, Tuple[int, ModuleType]] = {}
 
 def discover_skills() -> Dict[str, Skill]:
     skills: Dict[str, Skill] = {}
     for p in sorted(SKILLS_DIR.glob("skill_*.py")):
         try:
-            spec = importlib.util.spec_from_file_location(p.stem, p)
-            if not spec or not spec.loader:
-                continue
-            mod = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(mod)  # type: ignore
+            mtime = p.stat().st_mtime_ns
+            cached = _LOADED.get(str(p))
+            if cached and cached[0] == mtime:
+                mod = cached[1]
+            else:
+                spec = importlib.util.spec_from_file_location(p.stem, p)
+                if not spec or not spec.loader:
+                    continue
+                mod = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(mod)  # type: ignore
+                _LOADED[str(p)] = (mtime, mod)
             act_name = getattr(mod, "ACT_NAME", None)
             act_fn = getattr(mod, "act", None)
             if isinstance(act_name, str) and callable(act_fn):
@@ -221,6 +249,10 @@ def main():
 
     tick_interval = 1.0
     last_skill_scan = now_ts()
+    # Actions chosen since startup, oldest first. Not persisted (state.json is rewritten
+    # every tick); skills read it read-only via ctx["recent_actions"] and fall back to
+    # events.log while it is still shorter than the window they need.
+    recent_actions = deque(maxlen=RECENT_ACTIONS_KEEP)
     scan_period = 10.0
 
     while not STOP:
@@ -237,10 +269,11 @@ def main():
             actions = list(skills.keys())
             action = bandit.choose(actions)
 
-            ctx = {"state": state, "time": now_ts()}
+            ctx = {"state": state, "time": now_ts(), "recent_actions": recent_actions}
             reward = 0.0
             try:
-                r = skills[action].act(ctx)
+                skill = skills[action]
+                r = skill.act(ctx) if skill.due(state["ticks"]) else 0.0
                 if isinstance(r, (int, float)):
                     reward += float(r)
             except Exception as e:
@@ -258,10 +291,14 @@ def main():
             # Update bandit & persist
             bandit.update(action, reward)
             state["ticks"] += 1
+            recent_actions.append(action)
             la = state["last_actions"]
             la.append({"t": state["ticks"], "action": action, "reward": reward})
-            if len(la) > 25:
-                del la[:len(la)-25]
+            if len(la) > LAST_ACTIONS_KEEP:
+                del la[:len(la)-LAST_ACTIONS_KEEP]
+            notes = state.setdefault("notes", [])
+            if len(notes) > NOTES_KEEP:
+                del notes[:len(notes)-NOTES_KEEP]
 
             log_event("tick", {
                 "tick": state["ticks"],
@@ -0,0 +1,31 @@
+"""
+Reverse tailing of data/events.log, shared by the skills and tools that only need
+its newest lines (not a skill: the loader only picks up skill_*.py).
+"""
+
+from pathlib import Path
+
+# main.py's log_event() writes with json.dumps defaults, so every tick line contains
+# this exact byte sequence; lines without it cannot be ticks and are never parsed.
+TICK_MARK = b'"kind": "tick"'
+
+def iter_lines_reversed(path: Path, chunk: int, end: int | None = None):
+    """Yield non-empty lines of path[:end] newest-first, reading backwards in chunks (bytes)."""
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return
+    with f:
+        pos = f.seek(0, 2) if end is None else end
+        rest = b""
+        while pos > 0:
+            step = min(chunk, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + rest).split(b"\n")
+            rest = lines[0]  # possibly partial; completed by the next (earlier) chunk
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+        if rest:
+            yield rest
@@ -0,0 +1,92 @@
+"""
+Shared I/O for the wolf skills (not a skill: the loader only picks up skill_*.py).
+
+Imported the normal way, so it is loaded once per process and is NOT hot-reloaded:
+state caches and handles kept here outlive edits to the skills that use them, and a
+single set of atexit handlers flushes and closes them. Restart Guy after editing it.
+"""
+
+import atexit, json, os, time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict
+
+# ---------- Small JSON state files ----------
+# Kept in memory per path; each file is read once and written back (atomically,
+# compact) at most every STATE_FLUSH_SECS while dirty, plus once at exit.
+STATE_FLUSH_SECS = 30.0
+_STATES: Dict[Path, Dict[str, Any]] = {}
+
+def _state_entry(path: Path) -> Dict[str, Any]:
+    ent = _STATES.get(path)
+    if ent is None:
+        try:
+            val = json.loads(path.read_bytes())  # missing/corrupt -> fresh state
+        except Exception:
+            val = {}
+        ent = _STATES[path] = {"val": val, "dirty": False, "flushed": 0.0}
+    return ent
+
+def load_state(path: Path) -> Dict[str, Any]:
+    return _state_entry(path)["val"]
+
+def save_state(path: Path, d: Dict[str, Any]) -> None:
+    ent = _state_entry(path)
+    ent["val"], ent["dirty"] = d, True
+    if time.monotonic() - ent["flushed"] >= STATE_FLUSH_SECS:
+        _flush_state(path, ent)
+
+def _flush_state(path: Path, ent: Dict[str, Any]) -> None:
+    if not ent["dirty"]:
+        return
+    try:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(ent["val"], separators=(",", ":")))
+        os.replace(tmp, path)
+    except Exception:
+        return  # best-effort; stays dirty and is retried on the next save
+    ent["dirty"], ent["flushed"] = False, time.monotonic()
+
+@atexit.register
+def _flush_states() -> None:
+    for path, ent in _STATES.items():
+        _flush_state(path, ent)
+
+# ---------- Outbox event log and inbox ----------
+# One handle per path, kept open across calls and across skill reloads.
+_OUT_FHS: Dict[Path, BinaryIO] = {}
+_INBOX_FDS: Dict[Path, int] = {}
+
+def out_fh(path: Path) -> BinaryIO:
+    """Buffered append handle for an outbox JSONL; callers flush whole lines."""
+    fh = _OUT_FHS.get(path)
+    if fh is not None:
+        try:
+            if os.fstat(fh.fileno()).st_nlink > 0:
+                return fh
+        except OSError:
+            pass
+        fh.close()  # log was removed/rotated underneath us; reopen by name
+    path.parent.mkdir(parents=True, exist_ok=True)  # only on (re)open, not per event
+    fh = _OUT_FHS[path] = path.open("ab", buffering=1 << 20)
+    return fh
+
+def inbox_fd(path: Path) -> int:
+    """data/inbox.txt as an O_APPEND fd: each reward line is one os.write(), appended
+    atomically even though main.py truncates the file between ticks."""
+    fd = _INBOX_FDS.get(path)
+    if fd is not None:
+        try:
+            if os.fstat(fd).st_nlink > 0:
+                return fd
+            os.close(fd)  # inbox was removed and recreated; reopen by name
+        except OSError:
+            pass
+    fd = _INBOX_FDS[path] = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    return fd
+
+@atexit.register
+def _close_handles() -> None:
+    for fh in _OUT_FHS.values():
+        fh.close()
+    for fd in _INBOX_FDS.values():
+        os.close(fd)
@@ -2,26 +2,32 @@
 
 ACT_NAME = "mc_block_awareness"
 RUN_EVERY = 40        # check every 40 ticks
+LOADER_GATED = True
 EPS_BUMP = 0.03
 EPS_CAP  = 0.35
 DAMP     = 0.90       # damp risky action
 BOOST    = 0.08       # boost safer action
 
-SOLID = {"stone","dirt","deepslate","granite","andesite","diorite","cobblestone","oak_log","spruce_log","sand","gravel"}
-LIQUID = {"water","bubble_column","lava"}
+SOLID = frozenset({"stone","dirt","deepslate","granite","andesite","diorite","cobblestone","oak_log","spruce_log","sand","gravel"})
+LIQUID = frozenset({"water","bubble_column","lava"})
+AIR = frozenset({"air","cave_air"})
+NON_SOLID = AIR | LIQUID | {"void"}   # anything else at head height counts as solid
 
 def _mc(s):
     return s.get("mc", {}) if isinstance(s.get("mc"), dict) else {}
 
-def _in_suffocation(mc):
-    head = str(mc.get("block_head","")).lower()
-    str(mc.get("block_feet","")).lower()
-    in_wall = bool(mc.get("in_wall", False))
-    # Suffocation risk if in_wall or head is a solid block (not air/water)
-    return in_wall or (head not in ("air","cave_air") and head not in LIQUID and (head in SOLID or head not in ("air","water","lava","void")))
+def _block_head(mc):
+    head = mc.get("block_head")
+    if isinstance(head, str):
+        return head.lower()
+    return str(head).lower() if head else ""
 
-def _head_in_liquid(mc):
-    head = str(mc.get("block_head","")).lower()
+def _in_suffocation(mc, head):
+    # Suffocation risk if in_wall or head is a solid block (not air/liquid/void);
+    # a missing block_head is treated as risky, as it always was
+    return bool(mc.get("in_wall", False)) or head not in NON_SOLID
+
+def _head_in_liquid(head):
     return head in LIQUID
 
 def act(ctx):
@@ -34,18 +40,19 @@ def act(ctx):
     q = s.setdefault("q", {})
     eps = float(s.get("epsilon", 0.2))
 
-    risky = _in_suffocation(mc)
-    wet_head = _head_in_liquid(mc)
+    head = _block_head(mc)   # lowered once, shared by both predicates
+    risky = _in_suffocation(mc, head)
+    wet_head = _head_in_liquid(head)
 
     reward = 0.0
     if risky or wet_head:
         # Prefer moves that get to air and unstick
-        q["wolf_unstuck"] = max(float(q.get("wolf_unstuck", 0.0)), BOOST)
-        q["mc_move_to_air"] = max(float(q.get("mc_move_to_air", 0.0)), BOOST)
+        q["wolf_unstuck"] = max(q.get("wolf_unstuck", 0.0), BOOST)
+        q["mc_move_to_air"] = max(q.get("mc_move_to_air", 0.0), BOOST)
 
         # Soften generic wolf_actions to reduce pushing into the block again
         if "wolf_actions" in q:
-            q["wolf_actions"] = float(q["wolf_actions"]) * DAMP
+            q["wolf_actions"] = q["wolf_actions"] * DAMP
 
         # Explore alternatives slightly more when risky
         s["epsilon"] = min(EPS_CAP, eps + EPS_BUMP)
@@ -55,8 +62,8 @@ def act(ctx):
         reward = 0.02
 
     # Bound Q
-    for k,v in list(q.items()):
+    for k, v in q.items():
         if v > 1.0: q[k] = 1.0
-        if v < -1.0: q[k] = -1.0
+        elif v < -1.0: q[k] = -1.0
 
     return reward
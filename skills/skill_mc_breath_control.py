@@ -1,6 +1,7 @@
 # Breath control: watch air level & underwater state; climb/swim to air when needed
 ACT_NAME = "mc_breath_control"
 RUN_EVERY = 30
+LOADER_GATED = True
 AIR_LOW   = 6          # if remaining air <= this, treat as urgent (Minecraft max air ~300 ticks, but bridges often normalize)
 EPS_BUMP  = 0.04
 EPS_CAP   = 0.35
@@ -26,13 +27,13 @@ def act(ctx):
     reward = 0.0
     if underwater or air <= AIR_LOW:
         # Encourage reaching air
-        q["mc_swim_up"] = max(float(q.get("mc_swim_up", 0.0)), BOOST)
-        q["mc_move_to_air"] = max(float(q.get("mc_move_to_air", 0.0)), BOOST)
-        q["wolf_unstuck"] = max(float(q.get("wolf_unstuck", 0.0)), 0.06)
+        q["mc_swim_up"] = max(q.get("mc_swim_up", 0.0), BOOST)
+        q["mc_move_to_air"] = max(q.get("mc_move_to_air", 0.0), BOOST)
+        q["wolf_unstuck"] = max(q.get("wolf_unstuck", 0.0), 0.06)
 
         # Reduce persistence on generic actions that might force bad pathing
         if "wolf_actions" in q:
-            q["wolf_actions"] = float(q["wolf_actions"]) * DAMP
+            q["wolf_actions"] = q["wolf_actions"] * DAMP
 
         s["epsilon"] = min(EPS_CAP, eps + EPS_BUMP)
 
@@ -41,8 +42,8 @@ def act(ctx):
         reward = 0.02
 
     # Bound Q
-    for k,v in list(q.items()):
+    for k, v in q.items():
         if v > 1.0: q[k] = 1.0
-        if v < -1.0: q[k] = -1.0
+        elif v < -1.0: q[k] = -1.0
 
     return reward
@@ -1,6 +1,7 @@
 # Hazard avoidance: avoid lava/fire/fall and re-path aggressively
 ACT_NAME = "mc_hazard_avoidance"
 RUN_EVERY = 45
+LOADER_GATED = True
 BOOST = 0.09
 DAMP  = 0.88
 EPS_BUMP = 0.03
@@ -9,9 +10,15 @@ EPS_CAP  = 0.35
 def _mc(s):
     return s.get("mc", {}) if isinstance(s.get("mc"), dict) else {}
 
+def _block_head(mc):
+    head = mc.get("block_head")
+    if isinstance(head, str):
+        return head.lower()
+    return str(head).lower() if head else ""
+
 def _hazards(mc):
     return {
-        "lava": bool(mc.get("near_lava", False) or str(mc.get("block_head","")).lower()=="lava"),
+        "lava": bool(mc.get("near_lava", False) or _block_head(mc) == "lava"),
         "fire": bool(mc.get("on_fire", False)),
         "fall": bool(mc.get("fall_risk", False) or (mc.get("fall_distance", 0) or 0) > 3),
         "suffo": bool(mc.get("in_wall", False))
@@ -32,11 +39,11 @@ def act(ctx):
     reward = 0.0
     if risky:
         # Prefer re-path/escape
-        q["mc_path_recalc"] = max(float(q.get("mc_path_recalc", 0.0)), BOOST)
-        q["wolf_unstuck"]   = max(float(q.get("wolf_unstuck", 0.0)), 0.07)
+        q["mc_path_recalc"] = max(q.get("mc_path_recalc", 0.0), BOOST)
+        q["wolf_unstuck"]   = max(q.get("wolf_unstuck", 0.0), 0.07)
 
         if "wolf_actions" in q:
-            q["wolf_actions"] = float(q["wolf_actions"]) * DAMP
+            q["wolf_actions"] = q["wolf_actions"] * DAMP
 
         s["epsilon"] = min(EPS_CAP, eps + EPS_BUMP)
 
@@ -45,8 +52,8 @@ def act(ctx):
         reward = 0.02
 
     # Bound Q
-    for k,v in list(q.items()):
+    for k, v in q.items():
         if v > 1.0: q[k] = 1.0
-        if v < -1.0: q[k] = -1.0
+        elif v < -1.0: q[k] = -1.0
 
     return reward
@@ -1,6 +1,7 @@
 # Health manager: if health/hunger low, prefer retreat/eat decisions
 ACT_NAME = "mc_health_manager"
 RUN_EVERY = 55
+LOADER_GATED = True
 HEALTH_LOW = 8      # hearts*2; works with vanilla-style 20 max health
 HUNGER_LOW = 8      # shanks*1; vanilla 20 max food
 BOOST_RET  = 0.08
@@ -30,10 +31,10 @@ def act(ctx):
     reward = 0.0
     if need_heal or need_food:
         if need_heal:
-            q["mc_retreat"] = max(float(q.get("mc_retreat", 0.0)), BOOST_RET)
-            q["wolf_unstuck"] = max(float(q.get("wolf_unstuck", 0.0)), 0.06)
+            q["mc_retreat"] = max(q.get("mc_retreat", 0.0), BOOST_RET)
+            q["wolf_unstuck"] = max(q.get("wolf_unstuck", 0.0), 0.06)
         if need_food:
-            q["mc_eat"] = max(float(q.get("mc_eat", 0.0)), BOOST_EAT)
+            q["mc_eat"] = max(q.get("mc_eat", 0.0), BOOST_EAT)
 
         s["epsilon"] = min(EPS_CAP, eps + EPS_BUMP)
 
@@ -42,8 +43,8 @@ def act(ctx):
         reward = 0.02
 
     # Bound Q
-    for k,v in list(q.items()):
+    for k, v in q.items():
         if v > 1.0: q[k] = 1.0
-        if v < -1.0: q[k] = -1.0
+        elif v < -1.0: q[k] = -1.0
 
     return reward
@@ -24,15 +24,18 @@ def act(ctx):
     if not in_dream and ticks % RUN_EVERY != 0:
         return 0.0
     
-    # Load or initialize memory
+    # Load or initialize memory (a fresh/reset memory must be written once)
     memory = {}
+    dirty = False
     if MEMORY_FILE.exists():
         try:
             memory = json.loads(MEMORY_FILE.read_text())
         except:
             memory = {"events": [], "patterns": {}, "lessons": {}}
+            dirty = True
     else:
         memory = {"events": [], "patterns": {}, "lessons": {}}
+        dirty = True
     
     # During dream: consolidate and extract patterns
     if in_dream:
@@ -47,6 +50,7 @@ def act(ctx):
             avg_reward = sum(a.get("reward", 0) for a in last_actions[-3:]) / 3
             if avg_reward > 0.01:  # positive sequence
                 patterns[seq] = patterns.get(seq, 0) + 1
+                dirty = True
         
         # Store lesson: what breaks heartbeat loops
         if "heartbeat" in q and q["heartbeat"] < 0.02:
@@ -55,9 +59,12 @@ def act(ctx):
                 "method": "collective_skills",
                 "epsilon": s.get("epsilon", 0)
             }
+            dirty = True
         
         memory["patterns"] = patterns
-        memory["last_consolidation"] = ticks
+        if memory.get("last_consolidation") != ticks:
+            memory["last_consolidation"] = ticks
+            dirty = True
         
     else:
         # Normal operation: record significant events
@@ -70,6 +77,7 @@ def act(ctx):
                 "type": "loop_escaped",
                 "dominant": s.get("loop_breaker_last", {}).get("dominant")
             })
+            dirty = True
         
         # Record if policy was optimized
         if s.get("policy_optimizer_last", {}).get("corrected"):
@@ -78,17 +86,20 @@ def act(ctx):
                 "type": "policy_adjusted",
                 "entropy": s.get("policy_optimizer_last", {}).get("entropy", 0)
             })
+            dirty = True
         
         # Prune old events
         if len(events) > MEMORY_LIMIT:
             events = events[-MEMORY_LIMIT:]
+            dirty = True
         
         memory["events"] = events
     
-    # Save memory atomically
-    tmp = MEMORY_FILE.with_suffix(".tmp")
-    tmp.write_text(json.dumps(memory, indent=2))
-    tmp.replace(MEMORY_FILE)
+    # Save memory atomically, only if something above changed it
+    if dirty:
+        tmp = MEMORY_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps(memory, indent=2))
+        tmp.replace(MEMORY_FILE)
     
     # Store summary in state for other skills to access
     s["memory_bank_summary"] = {
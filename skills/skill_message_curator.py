@@ -17,7 +17,8 @@
 # Returns 0.0 (neutral) to avoid distorting the bandit; all shaping occurs via inbox reward lines.
 
 from pathlib import Path
-import json, time
+from collections import OrderedDict
+import heapq, json, os, time
 
 ACT_NAME = "message_curator"
 
@@ -31,6 +32,7 @@ RECENT_N = 8                    # scan only last 8 messages
 REWARD_COOLDOWN_SEC = 900       # ≥15 min between applied rewards
 AT_MOST_PER_DAY = 6             # daily cap
 MAX_HILITES = 20                # keep at most 20 highlight files
+SEEN_CAP = 64                   # remember at most 64 rewarded names (we only scan RECENT_N)
 
 # Reward magnitudes (modest to avoid overpowering other skills)
 R_MAINT = 0.50
@@ -46,38 +48,100 @@ def _consume_force_flag() -> bool:
         return True
     return False
 
+def _msg_mtimes(d: Path):
+    """Yield (name, mtime) for msg-*.json in d; one scandir pass, no extra stat per Path."""
+    with os.scandir(d) as it:
+        for de in it:
+            if de.name.startswith("msg-") and de.name.endswith(".json"):
+                try:
+                    yield de.name, de.stat().st_mtime
+                except OSError:
+                    continue
+
 def _recent_outbox(n: int):
-    if not OUTBOX_DIR.exists():
+    try:
+        top = heapq.nlargest(n, _msg_mtimes(OUTBOX_DIR), key=lambda x: x[1])
+    except FileNotFoundError:
         return []
-    files = sorted(OUTBOX_DIR.glob("msg-*.json"), key=lambda p: p.stat().st_mtime)
-    return files[-n:]
+    top.reverse()  # back to chronological (oldest → newest)
+    return [OUTBOX_DIR / name for name, _ in top]
+
+# Checked in priority order against the lowercased title prefix and tag set
+_HIGH_VALUE = (("maintenance", R_MAINT), ("alert", R_ALERT))
+_DREAM_TAGS = frozenset(("dream", "reflection"))
+# Byte-level sniff: a message that mentions none of these (any case) cannot classify
+_HV_HINTS = (b"maintenance", b"alert", b"dream", b"reflection")
+
+def _maybe_high_value(raw: bytes) -> bool:
+    low = raw.lower()
+    return any(h in low for h in _HV_HINTS)
 
 def _classify(payload: dict):
     """Return (kind, reward) or (None, 0.0). Only high-value kinds are rewarded."""
     title = (payload.get("title") or "").lower()
-    tags = [t.lower() for t in (payload.get("tags") or [])]
-    # maintenance
-    if "maintenance" in tags or title.startswith("maintenance"):
-        return ("maintenance", R_MAINT)
-    # alerts
-    if "alert" in tags or title.startswith("alert"):
-        return ("alert", R_ALERT)
+    tags = payload.get("tags") or ()
+    tagset = None
+    # maintenance, then alerts
+    for kind, reward in _HIGH_VALUE:
+        if title.startswith(kind):
+            return (kind, reward)
+        if tagset is None:
+            tagset = {str(t).lower() for t in tags}
+        if kind in tagset:
+            return (kind, reward)
     # dream reflection
-    if "dream" in tags or "reflection" in tags or title.startswith("dream"):
+    if title.startswith("dream") or not _DREAM_TAGS.isdisjoint(tagset):
         return ("dream", R_DREAM)
     # all else: not high-value
     return (None, 0.0)
 
+# Bounded LRU of rewarded message names; persisted as s["curator_seen"] (list, oldest first)
+_SEEN: "OrderedDict[str, None]" = OrderedDict()
+
+def _hydrate_seen(s) -> None:
+    if _SEEN:
+        return
+    names = s.get("curator_seen") or []
+    if len(names) > SEEN_CAP:
+        # Legacy list, dumped from an unbounded set in arbitrary order. Only names still in
+        # the outbox can be scanned again, so order by file mtime (gone files first) before
+        # capping instead of dropping an arbitrary slice.
+        try:
+            mtimes = dict(_msg_mtimes(OUTBOX_DIR))
+        except FileNotFoundError:
+            mtimes = {}
+        names = sorted(names, key=lambda n: mtimes.get(n, float("-inf")))
+    for name in names[-SEEN_CAP:]:
+        _SEEN[name] = None
+
+def _seen_hit(name: str) -> bool:
+    if name in _SEEN:
+        _SEEN.move_to_end(name)
+        return True
+    return False
+
+def _seen_add(name: str) -> None:
+    _SEEN[name] = None
+    _SEEN.move_to_end(name)
+    while len(_SEEN) > SEEN_CAP:
+        _SEEN.popitem(last=False)
+
 def _utc_day(ts: float) -> int:
     return int(ts // 86400)
 
 def _prune_highlights():
-    if not HILITE_DIR.exists():
+    try:
+        entries = list(_msg_mtimes(HILITE_DIR))
+    except FileNotFoundError:
+        return
+    if len(entries) <= MAX_HILITES:
         return
-    files = sorted(HILITE_DIR.glob("msg-*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-    for f in files[MAX_HILITES:]:
+    keep = {name for name, _ in heapq.nlargest(MAX_HILITES, entries, key=lambda x: x[1])}
+    for name, _ in entries:
+        if name in keep:
+            continue
         try:
-            f.unlink(missing_ok=True)
+            (HILITE_DIR / name).unlink(missing_ok=True)
         except Exception:
             pass
 
@@ -93,7 +157,7 @@ def act(ctx):
     HILITE_DIR.mkdir(parents=True, exist_ok=True)
 
     # State init
-    seen = set(s.get("curator_seen") or [])
+    _hydrate_seen(s)
     last_ts = float(s.get("curator_last_reward_ts", 0.0))
     day_info = s.get("curator_day") or {"day": _utc_day(time.time()), "count": 0}
     now = time.time()
@@ -115,10 +179,13 @@ def act(ctx):
 
     for p in candidates:
         name = p.name
-        if name in seen:
+        if _seen_hit(name):
             continue
         try:
-            payload = json.loads(p.read_text(encoding="utf-8"))
+            raw = p.read_bytes()
+            if not _maybe_high_value(raw):
+                continue
+            payload = json.loads(raw)  # json detects UTF-8 from bytes itself
         except Exception:
             continue
         k, r = _classify(payload)
@@ -146,7 +213,8 @@ def act(ctx):
         return 0.0
 
     # Mark seen first to avoid duplicates if anything below fails
-    seen.add(chosen[0].name)
+    _seen_add(chosen[0].name)
+    s["curator_seen"] = list(_SEEN)
 
     # Copy to highlights for surfacing
     try:
@@ -169,7 +237,6 @@ def act(ctx):
     s["curator_last_reward_ts"] = now
     day_info["count"] = int(day_info.get("count", 0)) + 1
     s["curator_day"] = day_info
-    s["curator_seen"] = list(seen)
     s["last_high_value_msg"] = (chosen[0].as_posix())
 
     # Trace
@@ -1,116 +1,208 @@
 # Seed-0 skill: pattern_detector - Recognizes recurring patterns in rewards and time
 # Predicts future outcomes based on observed patterns
+# Throttle: every RUN_EVERY ticks. Patterns over a 2000-event window barely move tick to tick,
+# so detection lags by at most RUN_EVERY ticks; s["pattern_insights"] keeps the last result.
 
 from pathlib import Path
-from collections import defaultdict, deque
-import json, time
+from collections import Counter, defaultdict, deque
+import hashlib, json, time
+from skills._logtail import iter_lines_reversed
 
 ACT_NAME = "pattern_detector"
 PATTERNS_FILE = Path("data/patterns.json")
 LOG_PATH = Path("data/events.log")
 MEMORY_FILE = Path("data/memory_bank.json")
 WINDOW_SIZE = 2000  # events to analyze
+RUN_EVERY = 15  # ticks between analyses
+LOADER_GATED = True
 MIN_OCCURRENCES = 3  # minimum pattern instances to consider valid
+TAIL_CHUNK = 256 * 1024  # bytes per backwards read when tailing the log
+RESEED_BYTES = 4 * 1024 * 1024  # bigger gaps since the last run are re-tailed, not read forward
+
+def _tail_events(path: Path, want: int, end=None):
+    """Last `want` parseable events of the log, oldest first; cost scales with want, not file size."""
+    events = []
+    for line in iter_lines_reversed(path, TAIL_CHUNK, end=end):
+        try:
+            events.append(json.loads(line))
+        except Exception:
+            continue
+        if len(events) >= want:
+            break
+    events.reverse()
+    return events
+
+# Parsed log tail kept across runs; events.log is append-only, so each run only
+# parses the bytes appended since the previous one (inode/size changes => re-tail).
+_CACHE = {"ino": None, "off": 0, "events": deque(maxlen=WINDOW_SIZE)}
+
+def _recent_events(path: Path):
+    buf = _CACHE["events"]
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _CACHE["ino"], _CACHE["off"] = None, 0
+        buf.clear()
+        return []
+    off = _CACHE["off"]
+    if st.st_ino != _CACHE["ino"] or st.st_size < off or st.st_size - off > RESEED_BYTES:
+        buf.clear()
+        buf.extend(_tail_events(path, WINDOW_SIZE, end=st.st_size))
+        _CACHE["ino"], _CACHE["off"] = st.st_ino, st.st_size
+    elif st.st_size > off:
+        with path.open("rb") as f:
+            f.seek(off)
+            data = f.read(st.st_size - off)
+        cut = data.rfind(b"\n") + 1  # leave a trailing partial line for next time
+        for line in data[:cut].split(b"\n"):
+            if line:
+                try:
+                    buf.append(json.loads(line))
+                except Exception:
+                    pass
+        _CACHE["off"] = off + cut
+    return list(buf)
+
+# (hour, weekday) per 15-minute epoch bucket. Every real UTC offset (DST included) is a
+# multiple of 15 minutes, so one localtime() per bucket is exact for all ts inside it.
+_LOCAL_BUCKET = 900
+_HOUR_DAY = {}
+
+def _hour_day(ts):
+    b = int(ts // _LOCAL_BUCKET)
+    hd = _HOUR_DAY.get(b)
+    if hd is None:
+        if len(_HOUR_DAY) > 4096:
+            _HOUR_DAY.clear()
+        lt = time.localtime(b * _LOCAL_BUCKET)
+        hd = _HOUR_DAY[b] = (lt.tm_hour, lt.tm_wday)
+    return hd
+
+# What was last written, so unchanged results skip the disk entirely
+_LAST_WRITE = {"patterns": None, "memory": None}
+
+def _dumps(obj) -> str:
+    # Machine-read files: compact separators, no indent (ASCII-escaped, so readers need no encoding)
+    return json.dumps(obj, separators=(",", ":"))
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text)
+    tmp.replace(path)
+
+def _content_hash(pattern_data) -> bytes:
+    """Digest of pattern_data minus its per-run timestamp/tick."""
+    body = {k: v for k, v in pattern_data.items() if k not in ("timestamp", "tick")}
+    return hashlib.blake2b(json.dumps(body, sort_keys=True).encode(), digest_size=8).digest()
 
 def get_hour_of_day():
     """Get current hour in 24h format"""
-    return time.localtime().tm_hour
+    return _hour_day(time.time())[0]
 
 def get_day_of_week():
     """Get day of week (0=Monday, 6=Sunday)"""
-    return time.localtime().tm_wday
+    return _hour_day(time.time())[1]
 
 def analyze_temporal_patterns(events):
     """Find time-based patterns in event outcomes"""
-    patterns = {
-        "hourly": defaultdict(lambda: {"success": 0, "fail": 0}),
-        "daily": defaultdict(lambda: {"success": 0, "fail": 0}),
-        "action_sequences": defaultdict(list),
-        "reward_after": defaultdict(list)
-    }
-    
-    # Analyze each event
-    for i, event in enumerate(events):
+    # One pass collects compact (action, bucket, outcome) tuple keys; Counter then bins
+    # them in C and the nested buckets are built once per distinct key instead of per event.
+    hour_keys = []
+    day_keys = []
+    action_sequences = {}  # {prev: {next: {"n", "sum", "avg"}}}, sums kept as we go
+    reward_after = defaultdict(list)
+
+    prev_action = None  # action of the previous event, only if it was a tick
+    for event in events:
         if event.get("kind") != "tick":
+            prev_action = None
             continue
-            
+
         action = event.get("action")
         reward = event.get("reward", 0)
         ts = event.get("ts", 0)
-        
+
         if not action:
+            prev_action = None
             continue
-            
+
         # Time-based patterns
-        hour = time.localtime(ts).tm_hour
-        day = time.localtime(ts).tm_wday
-        
-        if reward > 0:
-            patterns["hourly"][f"{action}_{hour}"]["success"] += 1
-            patterns["daily"][f"{action}_{day}"]["success"] += 1
-        elif reward < 0:
-            patterns["hourly"][f"{action}_{hour}"]["fail"] += 1
-            patterns["daily"][f"{action}_{day}"]["fail"] += 1
-        
-        # Sequential patterns (what follows what)
-        if i > 0:
-            prev_event = events[i-1]
-            if prev_event.get("kind") == "tick":
-                prev_action = prev_event.get("action")
-                if prev_action:
-                    seq_key = f"{prev_action}->{action}"
-                    patterns["action_sequences"][seq_key].append(reward)
-        
-        # Reward patterns (what gets rewarded after what)
-        if reward > 0 and i > 0:
-            prev_event = events[i-1]
-            if prev_event.get("kind") == "tick":
-                prev_action = prev_event.get("action")
-                if prev_action:
-                    patterns["reward_after"][prev_action].append((action, reward))
-    
-    return patterns
+        if reward:
+            hour, day = _hour_day(ts)
+            ok = reward > 0
+            hour_keys.append((action, hour, ok))
+            day_keys.append((action, day, ok))
+
+        if prev_action:
+            # Sequential patterns (what follows what)
+            nexts = action_sequences.get(prev_action)
+            if nexts is None:
+                nexts = action_sequences[prev_action] = {}
+            seq = nexts.get(action)
+            if seq is None:
+                seq = nexts[action] = {"n": 0, "sum": 0.0}
+            seq["n"] += 1
+            seq["sum"] += reward
+            # Reward patterns (what gets rewarded after what)
+            if reward > 0:
+                reward_after[prev_action].append((action, reward))
+        prev_action = action
+
+    # {action: {bucket: {"success", "fail"}}}: a given hour/day is one lookup per action,
+    # and no composite "action_bucket" strings are built or split apart again
+    def _bins(keys):
+        out = {}
+        for (action, bucket, ok), c in Counter(keys).items():
+            d = out.setdefault(action, {}).setdefault(bucket, {"success": 0, "fail": 0})
+            d["success" if ok else "fail"] += c
+        return out
+
+    for nexts in action_sequences.values():
+        for seq in nexts.values():
+            seq["avg"] = seq["sum"] / seq["n"]
+
+    return {
+        "hourly": _bins(hour_keys),
+        "daily": _bins(day_keys),
+        "action_sequences": action_sequences,
+        "reward_after": dict(reward_after)
+    }
 
 def calculate_pattern_strength(pattern_data):
-    """Calculate confidence score for a pattern"""
+    """Calculate confidence score for a pattern; returns (strength, sample count)"""
     if isinstance(pattern_data, dict):
         success = pattern_data.get("success", 0)
-        fail = pattern_data.get("fail", 0)
-        total = success + fail
+        total = success + pattern_data.get("fail", 0)
         if total < MIN_OCCURRENCES:
-            return 0
-        return (success / total) if total > 0 else 0
+            return 0, total
+        return success / total, total
     elif isinstance(pattern_data, list):
-        if len(pattern_data) < MIN_OCCURRENCES:
-            return 0
+        total = len(pattern_data)
+        if total < MIN_OCCURRENCES:
+            return 0, total
         positive = sum(1 for x in pattern_data if (x[1] if isinstance(x, tuple) else x) > 0)
-        return positive / len(pattern_data) if pattern_data else 0
-    return 0
+        return positive / total, total
+    return 0, 0
 
 def predict_next_action(patterns, state):
     """Predict best action based on patterns"""
     predictions = {}
     current_hour = get_hour_of_day()
-    get_day_of_week()
     last_action = state.get("last_actions", [{}])[-1].get("action") if state.get("last_actions") else None
     
     # Check hourly patterns
-    for key, data in patterns.get("hourly", {}).items():
-        if f"_{current_hour}" in key:
-            action = key.split("_")[0]
-            strength = calculate_pattern_strength(data)
+    for action, hours in patterns.get("hourly", {}).items():
+        data = hours.get(current_hour)
+        if data:
+            strength, _ = calculate_pattern_strength(data)
             if strength > 0.6:  # 60% success rate
                 predictions[action] = predictions.get(action, 0) + strength
     
     # Check sequential patterns
     if last_action:
-        for seq_key, rewards in patterns.get("action_sequences", {}).items():
-            if seq_key.startswith(f"{last_action}->"):
-                next_action = seq_key.split("->")[1]
-                if rewards and len(rewards) >= MIN_OCCURRENCES:
-                    avg_reward = sum(rewards) / len(rewards)
-                    if avg_reward > 0:
-                        predictions[next_action] = predictions.get(next_action, 0) + avg_reward
+        for next_action, seq in patterns.get("action_sequences", {}).get(last_action, {}).items():
+            if seq["n"] >= MIN_OCCURRENCES and seq["avg"] > 0:
+                predictions[next_action] = predictions.get(next_action, 0) + seq["avg"]
     
     # Check reward patterns
     if last_action in patterns.get("reward_after", {}):
@@ -129,18 +221,11 @@ def predict_next_action(patterns, state):
 def act(ctx):
     s = ctx["state"]
     ticks = int(s.get("ticks", 0))
+    if ticks % RUN_EVERY != 0:
+        return 0.0
     
     # Load recent events
-    events = deque(maxlen=WINDOW_SIZE)
-    if LOG_PATH.exists():
-        with LOG_PATH.open("r") as f:
-            for line in f:
-                try:
-                    events.append(json.loads(line))
-                except:
-                    pass
-    
-    events_list = list(events)
+    events_list = _recent_events(LOG_PATH)
     
     # Analyze patterns
     patterns = analyze_temporal_patterns(events_list)
@@ -152,21 +237,20 @@ def act(ctx):
     strong_patterns = []
     
     # Check for time-based patterns
-    for key, data in patterns.get("hourly", {}).items():
-        strength = calculate_pattern_strength(data)
-        if strength > 0.7 and data.get("success", 0) + data.get("fail", 0) >= MIN_OCCURRENCES:
-            action, hour = key.rsplit("_", 1)
-            if strength > 0.8:
-                strong_patterns.append(f"{action} works best at {hour}:00")
-            elif strength < 0.3:
-                strong_patterns.append(f"{action} fails often at {hour}:00")
+    for action, hours in patterns.get("hourly", {}).items():
+        for hour, data in hours.items():
+            strength, total = calculate_pattern_strength(data)
+            if strength > 0.7 and total >= MIN_OCCURRENCES:
+                if strength > 0.8:
+                    strong_patterns.append(f"{action} works best at {hour}:00")
+                elif strength < 0.3:
+                    strong_patterns.append(f"{action} fails often at {hour}:00")
     
     # Check for sequence patterns
-    for seq_key, rewards in patterns.get("action_sequences", {}).items():
-        if len(rewards) >= MIN_OCCURRENCES:
-            avg = sum(rewards) / len(rewards)
-            if abs(avg) > 0.02:
-                prev, next = seq_key.split("->")
+    for prev, nexts in patterns.get("action_sequences", {}).items():
+        for next, seq in nexts.items():
+            avg = seq["avg"]
+            if seq["n"] >= MIN_OCCURRENCES and abs(avg) > 0.02:
                 if avg > 0:
                     strong_patterns.append(f"{next} after {prev} → reward {avg:.3f}")
                 else:
@@ -180,13 +264,16 @@ def act(ctx):
         "predictions": predictions,
         "strong_patterns": strong_patterns[:10],  # Top 10
         "statistics": {
-            "hourly_patterns": len(patterns.get("hourly", {})),
-            "sequence_patterns": len(patterns.get("action_sequences", {})),
+            "hourly_patterns": sum(len(h) for h in patterns.get("hourly", {}).values()),
+            "sequence_patterns": sum(len(n) for n in patterns.get("action_sequences", {}).values()),
             "reward_patterns": len(patterns.get("reward_after", {}))
         }
     }
     
-    PATTERNS_FILE.write_text(json.dumps(pattern_data, indent=2))
+    digest = _content_hash(pattern_data)
+    if digest != _LAST_WRITE["patterns"] or not PATTERNS_FILE.exists():
+        _atomic_write(PATTERNS_FILE, _dumps(pattern_data))
+        _LAST_WRITE["patterns"] = digest
     
     # Update state with pattern insights
     s["pattern_insights"] = {
@@ -206,11 +293,14 @@ def act(ctx):
             q[best_action] = q[best_action] * 1.05  # 5% boost
     
     # Update memory if strong patterns found
-    if strong_patterns and MEMORY_FILE.exists():
+    # (memory_bank.json is shared with the memory_bank skill, so it is re-read, not cached)
+    top = strong_patterns[:3]
+    if top and top != _LAST_WRITE["memory"] and MEMORY_FILE.exists():
         try:
             memory = json.loads(MEMORY_FILE.read_text())
-            memory["patterns"][f"tick_{ticks}"] = strong_patterns[:3]
-            MEMORY_FILE.write_text(json.dumps(memory, indent=2))
+            memory["patterns"][f"tick_{ticks}"] = top
+            _atomic_write(MEMORY_FILE, _dumps(memory))
+            _LAST_WRITE["memory"] = top
         except:
             pass
     
@@ -12,7 +12,9 @@
 
 from pathlib import Path
 from collections import deque, Counter
+from itertools import groupby
 import json, math
+from skills._logtail import iter_lines_reversed
 
 ACT_NAME = "policy_optimizer"
 
@@ -43,64 +45,89 @@ Q_UCB_COEF    = 0.10   # strength of optimism bonus
 Q_UCB_BLEND   = 0.10   # how much of the bonus to blend into Q
 Q_MAX_ABS     = 1.0
 
-def _tail_ticks(path: Path, want: int):
-    evts = deque(maxlen=want*2)
-    if not path.exists():
+TAIL_CHUNK    = 256 * 1024  # bytes per backwards read when tailing the log
+RESEED_BYTES  = 4 * 1024 * 1024  # bigger gaps since the last run are re-tailed, not read forward
+
+def _tail_ticks(path: Path, want: int, end=None):
+    """Last `want` tick events, oldest first; reads only as far back as needed."""
+    evts = []
+    for line in iter_lines_reversed(path, TAIL_CHUNK, end=end):
+        try:
+            e = json.loads(line)
+        except Exception:
+            continue
+        if e.get("kind") == "tick":
+            evts.append(e)
+            if len(evts) >= want:
+                break
+    evts.reverse()
+    return evts
+
+# Tick events kept across runs; events.log is append-only, so each run only parses
+# the bytes appended since the previous one (inode/size changes => re-tail).
+_CACHE = {"ino": None, "off": 0, "ticks": deque(maxlen=WINDOW_TICKS)}
+
+def _recent_ticks(path: Path):
+    buf = _CACHE["ticks"]
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _CACHE["ino"], _CACHE["off"] = None, 0
+        buf.clear()
         return []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
+    off = _CACHE["off"]
+    if st.st_ino != _CACHE["ino"] or st.st_size < off or st.st_size - off > RESEED_BYTES:
+        buf.clear()
+        buf.extend(_tail_ticks(path, WINDOW_TICKS, end=st.st_size))
+        _CACHE["ino"], _CACHE["off"] = st.st_ino, st.st_size
+    elif st.st_size > off:
+        with path.open("rb") as f:
+            f.seek(off)
+            data = f.read(st.st_size - off)
+        cut = data.rfind(b"\n") + 1  # leave a trailing partial line for next time
+        for line in data[:cut].split(b"\n"):
+            if not line:
+                continue
             try:
                 e = json.loads(line)
-                if e.get("kind") == "tick":
-                    evts.append(e)
             except Exception:
-                pass
-    return list(evts)[-want:]
+                continue
+            if e.get("kind") == "tick":
+                buf.append(e)
+        _CACHE["off"] = off + cut
+    return list(buf)
 
 def _longest_streak(seq):
-    if not seq:
-        return 0
-    best = 1
-    cur = 1
-    prev = seq[0]
-    for a in seq[1:]:
-        if a == prev:
-            cur += 1
-            if cur > best:
-                best = cur
-        else:
-            cur = 1
-            prev = a
-    return best
+    # groupby walks each run in C; Python only steps once per run, not per element
+    return max((len(list(run)) for _, run in groupby(seq)), default=0)
 
 def _normalized_entropy(counter: Counter) -> float:
     total = sum(counter.values())
     k = len(counter)
     if total <= 0 or k <= 1:
         return 0.0
-    h = 0.0
-    for c in counter.values():
-        p = c / total
-        if p > 0:
-            h -= p * math.log(p + 1e-12)
-    hmax = math.log(k + 1e-12)
-    return float(h / hmax) if hmax > 0 else 0.0
+    # H = -sum(p log p) = log(total) - sum(c log c) / total, straight from the counts
+    h = math.log(total) - math.fsum(c * math.log(c) for c in counter.values() if c > 0) / total
+    return float(h / math.log(k))
+
+def _avg_reward(evts, lo, hi):
+    s = 0.0; n = 0
+    for i in range(lo, hi):
+        r = evts[i].get("reward", 0.0)
+        if r.__class__ is not float:  # main.py always logs floats; coerce anything else
+            try:
+                r = float(r)
+            except Exception:
+                continue
+        s += r; n += 1
+    return (s / n) if n else 0.0
 
 def _nonstationarity(evts):
-    # compare avg reward of first vs second half of window
+    # compare avg reward of first vs second half of window (index ranges, no slice copies)
     if not evts:
         return 0.0
     m = len(evts) // 2
-    def avg(arr):
-        s = 0.0; n = 0
-        for e in arr:
-            try:
-                s += float(e.get("reward", 0.0)); n += 1
-            except Exception:
-                pass
-        return (s / n) if n else 0.0
-    a1 = avg(evts[:m]); a2 = avg(evts[m:])
-    return abs(a2 - a1)
+    return abs(_avg_reward(evts, m, len(evts)) - _avg_reward(evts, 0, m))
 
 def act(ctx):
     s = ctx["state"]
@@ -117,7 +144,7 @@ def act(ctx):
     if eps < EPS_FLOOR:
         s["epsilon"] = EPS_FLOOR
 
-    evts = _tail_ticks(LOG_PATH, WINDOW_TICKS)
+    evts = _recent_ticks(LOG_PATH)
     total = len(evts)
     if total < MIN_SAMPLE:
         # Not enough data; gently cool toward floors
@@ -159,22 +186,24 @@ def act(ctx):
     # 4) UCB-style optimism: add small bonus to rarely tried actions (based on n)
     # We blend a fraction of (q + bonus) back into q to avoid runaway changes.
     N = sum(int(n.get(a, 0)) for a in cnt) + 1
+    # q*(1-B) + (q+bonus)*B == q + B*bonus, so each Q is read and written once.
     if N > 1:
+        ucb_scale = Q_UCB_BLEND * Q_UCB_COEF * math.sqrt(math.log(N + 1.0))
         for a in cnt:
             na = max(1, int(n.get(a, 0)))
-            bonus = Q_UCB_COEF * math.sqrt(math.log(N + 1.0) / na)
-            q[a] = float(q.get(a, 0.0)) * (1.0 - Q_UCB_BLEND) + (float(q.get(a, 0.0)) + bonus) * Q_UCB_BLEND
+            q[a] = q.get(a, 0.0) + ucb_scale / math.sqrt(na)
 
     # 5) Soft temperature mix when highly peaked: bring Qs slightly toward their mean
     if frac >= 0.85 or ent < 0.55:
         if q:
-            mean_q = sum(float(v) for v in q.values()) / max(1, len(q))
-            for a in list(q.keys()):
-                q[a] = float(q[a]) * (1.0 - Q_TEMP_MIX) + mean_q * Q_TEMP_MIX
+            mean_q = sum(q.values()) / len(q)
+            keep, pull = 1.0 - Q_TEMP_MIX, mean_q * Q_TEMP_MIX
+            for a, v in q.items():
+                q[a] = v * keep + pull
         corrected = True or corrected
 
-    # Clamp Q-values
-    for k, v in list(q.items()):
+    # Clamp Q-values (in place; values only, so no copy of items() needed)
+    for k, v in q.items():
         if v > Q_MAX_ABS:
             q[k] = Q_MAX_ABS
         elif v < -Q_MAX_ABS:
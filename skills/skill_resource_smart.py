@@ -27,6 +27,10 @@ LIGHT        = {"heartbeat","reflect","compress_memory","signal","communicate"}
 LOAD_BUSY    = 0.80
 LOAD_IDLE    = 0.35
 
+# Process CPU thresholds (fraction of ONE core; Guy's loop is single-threaded)
+PROC_BUSY    = 0.60
+PROC_IDLE    = 0.15
+
 # Memory thresholds (MB)
 MEM_LOW_MB   = 256
 MEM_OK_MB    = 1024
@@ -49,42 +53,67 @@ Q_MIN_HEAVY_IDLE = 0.05     # ensure heavy actions have at least this Q when idl
 Q_NEAR_WIN   = 0.10         # bump heavy Q near their due windows
 Q_MAX_ABS    = 1.0
 
+_CORES = max(1, os.cpu_count() or 1)  # fixed for the process lifetime; read once at import
+
 def _norm_load():
     try:
         la1, _, _ = os.getloadavg()
-        cores = max(1, os.cpu_count() or 1)
-        return float(la1) / float(cores)
+        return la1 / _CORES
     except Exception:
         return 0.0
 
-def _mem_available_mb():
+# Memory/disk readings change on a seconds scale; reuse them for PROBE_TTL_S.
+PROBE_TTL_S  = 5.0
+_PROBES = {}  # name -> (monotonic_ts, value)
+
+def _cached(name, fn):
+    now = time.monotonic()
+    hit = _PROBES.get(name)
+    if hit is not None and now - hit[0] < PROBE_TTL_S:
+        return hit[1]
+    val = fn()
+    _PROBES[name] = (now, val)
+    return val
+
+def _read_mem_available_mb():
+    # MemAvailable is the 3rd line of /proc/meminfo: one short read, no line iteration
     try:
-        with open("/proc/meminfo","r") as f:
-            for line in f:
-                if line.startswith("MemAvailable:"):
-                    parts = line.split()
-                    kb = float(parts[1])
-                    return kb/1024.0
+        with open("/proc/meminfo", "rb") as f:
+            head = f.read(256)
+            i = head.find(b"MemAvailable:")
+            if i < 0:
+                head += f.read()
+                i = head.find(b"MemAvailable:")
+            if i >= 0:
+                kb = float(head[i:].split(None, 2)[1])
+                return kb/1024.0
     except Exception:
         pass
     return None  # unknown
 
-def _disk_free_gb(path="."):
+def _mem_available_mb():
+    return _cached("mem", _read_mem_available_mb)
+
+def _read_disk_free_gb(path="."):
     try:
         du = shutil.disk_usage(path)
         return du.free / (1024**3)
     except Exception:
         return None
 
+def _disk_free_gb(path="."):
+    return _cached(("disk", path), lambda: _read_disk_free_gb(path))
+
 def _proc_cpu_fraction(state):
-    # Estimate process CPU usage over the last interval
+    # Estimate process CPU usage over the last interval, as a fraction of one core
+    # (not divided by _CORES: the main loop can only saturate a single core).
     now = time.time()
     cpu = time.process_time()
     last = state.get("_rs_last", {})
     last_cpu = float(last.get("cpu", cpu))
     last_ts  = float(last.get("ts", now))
     dt = max(1e-3, now - last_ts)
-    frac = max(0.0, (cpu - last_cpu) / dt)  # ~0..Ncores but we treat it as fraction heuristically
+    frac = max(0.0, (cpu - last_cpu) / dt)  # ~0..1, above 1 only if worker threads add load
     state["_rs_last"] = {"cpu": cpu, "ts": now}
     return frac
 
@@ -107,9 +136,9 @@ def act(ctx):
     pfrac = _proc_cpu_fraction(s)
 
     # Busy / Idle heuristics
-    is_busy = (load >= LOAD_BUSY) or (pfrac >= 0.6) or (disk_gb is not None and disk_gb < DISK_LOW_GB) \
+    is_busy = (load >= LOAD_BUSY) or (pfrac >= PROC_BUSY) or (disk_gb is not None and disk_gb < DISK_LOW_GB) \
               or (mem_mb is not None and mem_mb < MEM_LOW_MB)
-    is_idle = (load <= LOAD_IDLE) and (mem_mb is None or mem_mb >= MEM_OK_MB) and (pfrac <= 0.15)
+    is_idle = (load <= LOAD_IDLE) and (mem_mb is None or mem_mb >= MEM_OK_MB) and (pfrac <= PROC_IDLE)
 
     adjusted = False
 
@@ -119,10 +148,11 @@ def act(ctx):
         if new_eps != eps:
             s["epsilon"] = new_eps; eps = new_eps; adjusted = True
         # Damp heavy action Q, favor light actions minimum
-        for a in list(q.keys()):
-            if a in HEAVY:
-                q[a] = float(q.get(a, 0.0)) * Q_DAMP_HEAVY; adjusted = True
-            elif a in LIGHT and float(q.get(a, 0.0)) < Q_MIN_LIGHT:
+        for a in HEAVY:
+            if a in q:
+                q[a] = q[a] * Q_DAMP_HEAVY; adjusted = True
+        for a in LIGHT:
+            if a in q and q[a] < Q_MIN_LIGHT:
                 q[a] = Q_MIN_LIGHT; adjusted = True
         s["resource_mode"] = "busy"
     elif is_idle:
@@ -132,14 +162,14 @@ def act(ctx):
             s["epsilon"] = new_eps; eps = new_eps; adjusted = True
         # Encourage heavy maintenance slightly (especially near windows)
         for a in HEAVY:
-            if float(q.get(a, 0.0)) < Q_MIN_HEAVY_IDLE:
+            if q.get(a, 0.0) < Q_MIN_HEAVY_IDLE:
                 q[a] = Q_MIN_HEAVY_IDLE; adjusted = True
         nb = _next_due(ticks, 120)   # self_bundle window
         nv = _next_due(ticks, 180)   # self_verify window
         if nb <= 2:
-            q["self_bundle"] = max(float(q.get("self_bundle", 0.0)), Q_NEAR_WIN); adjusted = True
+            q["self_bundle"] = max(q.get("self_bundle", 0.0), Q_NEAR_WIN); adjusted = True
         if nv <= 2:
-            q["self_verify"] = max(float(q.get("self_verify", 0.0)), Q_NEAR_WIN); adjusted = True
+            q["self_verify"] = max(q.get("self_verify", 0.0), Q_NEAR_WIN); adjusted = True
         s["resource_mode"] = "idle"
     else:
         # Normal — drift epsilon gently toward a baseline
@@ -149,8 +179,8 @@ def act(ctx):
             adjusted = True
         s["resource_mode"] = "normal"
 
-    # Clamp Q range
-    for k, v in list(q.items()):
+    # Clamp Q range (in place; values only, so no copy of items() needed)
+    for k, v in q.items():
         if v > Q_MAX_ABS: q[k] = Q_MAX_ABS
         elif v < -Q_MAX_ABS: q[k] = -Q_MAX_ABS
 
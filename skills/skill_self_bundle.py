@@ -11,23 +11,52 @@ def _consume_force_flag() -> bool:
         return True
     return False
 
+HASH_CHUNK = 4 * 1024 * 1024
+ZIP_LEVEL = 1  # fastest deflate: ~3-5x quicker than level 6 on source text, archive ~10% larger
+
+# One reusable read buffer for all hashing (skills run one at a time on the main loop):
+# readinto() fills it in place, so no per-chunk bytes objects are allocated.
+_HASH_BUF = bytearray(HASH_CHUNK)
+_HASH_MV = memoryview(_HASH_BUF)
+
 def _sha256_file(p: Path) -> str:
     h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024*1024), b""): h.update(chunk)
+    with p.open("rb", buffering=0) as f:
+        while n := f.readinto(_HASH_BUF): h.update(_HASH_MV[:n])
     return h.hexdigest()
 
+# zf.open(ZipInfo, "w") only inherits compression when given a name, and a name would lose
+# from_file()'s mtime/mode. The per-entry level is public as compress_level from 3.13 on.
+_ZI_LEVEL_ATTR = "compress_level" if hasattr(zipfile.ZipInfo("x"), "compress_level") else "_compresslevel"
+
+def _add_hashed(zf: zipfile.ZipFile, p: Path, arcname: str) -> dict:
+    """Stream p into zf and hash the same bytes: one read per file, no re-read for the zip."""
+    zi = zipfile.ZipInfo.from_file(p, arcname)
+    zi.compress_type = zf.compression; setattr(zi, _ZI_LEVEL_ATTR, zf.compresslevel)  # as ZipFile.write() does
+    h = hashlib.sha256(); size = 0
+    with p.open("rb", buffering=0) as src, zf.open(zi, "w") as dst:
+        while n := src.readinto(_HASH_BUF):
+            chunk = _HASH_MV[:n]; h.update(chunk); dst.write(chunk); size += n
+    return {"path": arcname, "sha256": h.hexdigest(), "size": size}
+
+EXCLUDE_DIRS = frozenset({"data", ".git", "__pycache__", ".pytest_cache", ".venv", "venv", ".idea", ".mypy_cache"})
+EXCLUDE_SUFFIXES = frozenset({".pyc", ".pyo", ".log", ".tmp"})
+
 def _gather_files(root: Path):
-    EXCLUDE_DIRS = {"data", ".git", "__pycache__", ".pytest_cache", ".venv", "venv", ".idea", ".mypy_cache"}
-    EXCLUDE_SUFFIXES = {".pyc", ".pyo", ".log", ".tmp"}
-    for p in root.rglob("*"):
-        if p.is_dir():
-            if any(part in EXCLUDE_DIRS for part in p.parts): continue
-            else: continue
-        if any(part in EXCLUDE_DIRS for part in p.parents): continue
-        if p.suffix in EXCLUDE_SUFFIXES: continue
-        if "data" in p.parts and "releases" in p.parts: continue
-        yield p
+    """Yield bundle candidates; excluded dirs are pruned before descending (one scandir per dir)."""
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try: it = os.scandir(d)
+        except OSError: continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if e.name not in EXCLUDE_DIRS: stack.append(e.path)
+                    elif e.is_file() and os.path.splitext(e.name)[1] not in EXCLUDE_SUFFIXES:
+                        yield Path(e.path)
+                except OSError: continue
 
 def act(ctx):
     s = ctx["state"]; ticks = int(s.get("ticks", 0))
@@ -40,19 +69,15 @@ def act(ctx):
     tmp_zip = Path(tmp_path); final_zip = release_dir / f"fgseed-{ts}.zip"
 
     try:
-        files = list(_gather_files(root))
+        files = sorted(_gather_files(root))  # sorted => deterministic manifest order
         manifest = []
-        for p in files:
-            try: rel = p.relative_to(root).as_posix()
-            except ValueError: continue
-            manifest.append({"path": rel, "sha256": _sha256_file(p), "size": p.stat().st_size})
-
-        with zipfile.ZipFile(tmp_zip, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
-            for e in manifest: zf.write(root / e["path"], arcname=e["path"])
+        with zipfile.ZipFile(tmp_zip, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_LEVEL) as zf:
+            for p in files:
+                try: rel = p.relative_to(root).as_posix()
+                except ValueError: continue
+                manifest.append(_add_hashed(zf, p, rel))
             zf.writestr("manifest.json", json.dumps({"created_ts": ts, "file_count": len(manifest), "files": manifest}, ensure_ascii=False, indent=2))
-
-        with zipfile.ZipFile(tmp_zip, "r") as zf:
-            if zf.testzip() is not None: tmp_zip.unlink(missing_ok=True); return -0.4
+        # no testzip(): CRC-32 is computed while writing, re-reading the archive adds nothing
 
         tmp_zip.replace(final_zip)
         checksum = _sha256_file(final_zip)
@@ -8,9 +8,11 @@
 
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
+from collections import Counter, deque
 import json
 import math
 import time
+from skills._logtail import iter_lines_reversed
 
 ACT_NAME = "self_coder"
 
@@ -39,6 +41,9 @@ MAX_CONCURRENT_PROB = 2        # at most N active probation skills at once
 Q_FENCE_DISABLED = 1e-6        # Q to pin disabled skills to (self-throttle)
 NEW_SKILL_REWARD = 0.2         # reward when we successfully generate
 TICK_COOLDOWN = 80             # min ticks between heavy analyses (perf)
+REGISTRY_FLUSH_EVERY = 10      # refreshes between registry writes when no gate field changed
+TAIL_CHUNK = 128 * 1024        # bytes per backwards read when tailing events.log
+RESEED_BYTES = 4 * 1024 * 1024 # larger gaps since the last metrics pass are re-tailed, not read forward
 
 # -----------------------------------------------------------------------------
 # Utilities
@@ -53,8 +58,42 @@ def _load_json(path: Path, default: Any) -> Any:
         return default
 
 def _save_json(path: Path, data: Any) -> None:
+    # Compact, and atomic (tmp + replace) so readers such as the auto_skill gates never see
+    # a torn file. ASCII-escaped, since readers call read_text() without an encoding.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2))
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, separators=(",", ":")))
+    tmp.replace(path)
+
+# Parsed registry keyed by the (mtime_ns, size) it was loaded or last saved with; act()
+# and update_registry() reuse it until the file's key changes. It may run ahead of disk
+# (update_registry skips unchanged-gate writes), and when another writer such as
+# greenlight replaces the file, the next call reloads the file's version and drops ours.
+_REG_CACHE: Dict[str, Any] = {"key": None, "val": None}
+
+def _load_registry_cached() -> Dict[str, Any]:
+    try:
+        st = REGISTRY_FILE.stat()
+    except OSError:
+        _REG_CACHE.update(key=None, val=None)
+        return {}
+    key = (st.st_mtime_ns, st.st_size)
+    if key != _REG_CACHE["key"]:
+        reg = _load_json(REGISTRY_FILE, {})
+        # A new key means another writer (e.g. greenlight retiring duds) may have changed
+        # statuses without touching "counts": never trust the persisted tally on reload.
+        if isinstance(reg, dict):
+            _recount_statuses(reg)
+        _REG_CACHE.update(key=key, val=reg)
+    return _REG_CACHE["val"]
+
+def _save_registry(reg: Dict[str, Any]) -> None:
+    _save_json(REGISTRY_FILE, reg)
+    try:
+        st = REGISTRY_FILE.stat()
+        _REG_CACHE.update(key=(st.st_mtime_ns, st.st_size), val=reg)
+    except OSError:
+        _REG_CACHE.update(key=None, val=None)
 
 def _now() -> float:
     return time.time()
@@ -62,34 +101,101 @@ def _now() -> float:
 def _is_auto(action: str) -> bool:
     return isinstance(action, str) and action.startswith("auto_skill_")
 
-def _iter_events(path: Path, limit: int) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    out: List[Dict[str, Any]] = []
-    with path.open("r", errors="ignore") as f:
-        for line in f:
-            try:
-                d = json.loads(line)
-            except Exception:
-                continue
-            out.append(d)
-    return out[-limit:] if limit else out
-
-def _mean(xs: List[float]) -> float:
-    vals = [x for x in xs if isinstance(x, (int, float))]
-    return sum(vals) / len(vals) if vals else 0.0
+def _parse_line(line: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(line)
+    except Exception:
+        pass
+    try:
+        return json.loads(line.decode("utf-8", "ignore"))  # same leniency as errors="ignore"
+    except Exception:
+        return None
 
 # -----------------------------------------------------------------------------
 # Metrics & Registry maintenance
 # -----------------------------------------------------------------------------
 
+def _metric_rec(d: Dict[str, Any]) -> Tuple[Optional[str], Optional[float], Optional[int]]:
+    """(auto_skill name or None, reward float or None, int tick or None): every field the
+    metrics read, typed once at parse time so the aggregation loop does no coercion."""
+    r = d.get("reward", None)
+    if r is not None and r.__class__ is not float:
+        try:
+            r = float(r)
+        except Exception:
+            r = None
+    a = d.get("action", "")
+    t = d.get("tick")
+    return (a if _is_auto(a) else None), r, (t if isinstance(t, int) else None)
+
+# An event with neither an auto_skill name nor a reward field only adds to the
+# non-auto count, so such lines are counted without being parsed.
+_BLANK_REC = (None, None, None)
+
+def _line_rec(line: bytes):
+    if b"auto_skill_" not in line and b'"reward"' not in line:
+        # still require a complete JSON object, as a parse would
+        return _BLANK_REC if line[:1] == b"{" and line.rstrip()[-1:] == b"}" else None
+    d = _parse_line(line)
+    return None if d is None else _metric_rec(d)
+
+def _tail_recs(path: Path, want: int, end: int) -> List[Tuple[Any, Optional[float], Optional[int]]]:
+    """Metric records of the last `want` events, oldest first; reads from the end."""
+    out = []
+    for line in iter_lines_reversed(path, TAIL_CHUNK, end=end):
+        rec = _line_rec(line)
+        if rec is not None:
+            out.append(rec)
+            if len(out) >= want:
+                break
+    out.reverse()
+    return out
+
+# In-process memo for compute_recent_metrics. events.log is append-only between
+# rotations, so only bytes past "off" are parsed on each call, and an unchanged
+# log (same inode/size) returns the previous result without touching the file.
+_METRICS: Dict[str, Any] = {"ino": None, "off": 0, "recs": deque(maxlen=WINDOW_EVENTS), "val": None}
+
+def _recent_recs(path: Path) -> Optional[deque]:
+    """Window of metric records, refreshed incrementally; None when the log is unchanged."""
+    recs = _METRICS["recs"]
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _METRICS.update(ino=None, off=0, val=None)
+        recs.clear()
+        return recs
+    off = _METRICS["off"]
+    if st.st_ino != _METRICS["ino"] or st.st_size < off or st.st_size - off > RESEED_BYTES:
+        recs.clear()
+        recs.extend(_tail_recs(path, WINDOW_EVENTS, st.st_size))
+        _METRICS.update(ino=st.st_ino, off=st.st_size)
+    elif st.st_size > off:
+        with path.open("rb") as f:
+            f.seek(off)
+            data = f.read(st.st_size - off)
+        cut = data.rfind(b"\n") + 1  # leave a trailing partial line for next time
+        if not cut:
+            return None if _METRICS["val"] is not None else recs
+        for line in data[:cut].split(b"\n"):
+            if line:
+                rec = _line_rec(line)
+                if rec is not None:
+                    recs.append(rec)
+        _METRICS["off"] = off + cut
+    elif _METRICS["val"] is not None:
+        return None
+    return recs
+
 def compute_recent_metrics() -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Returns:
       recent: dict with auto_skill_pct, baseline_non_auto_avg, non_auto_nonzero_rate, sample_size
       per_auto: dict[name] = {uses, avg_reward, nonzero_rate, last_tick}
     """
-    ev = _iter_events(EVENTS_LOG, WINDOW_EVENTS)
+    ev = _recent_recs(EVENTS_LOG)
+    if ev is None:
+        return _METRICS["val"]
     if not ev:
         return (
             {
@@ -101,51 +207,46 @@ def compute_recent_metrics() -> Tuple[Dict[str, Any], Dict[str, Any]]:
             {},
         )
 
-    non_auto_rewards: List[float] = []
-    non_auto_count = 0
+    # One pass of running sums/counts (records carry float-or-None rewards); means at the end
+    non_auto_sum = 0.0
+    non_auto_rewarded = 0
     non_auto_nonzero = 0
-    auto_rewards_by_name: Dict[str, List[float]] = {}
+    auto_uses: Counter = Counter()
+    auto_sum: Dict[str, float] = {}
+    auto_nonzero: Counter = Counter()
     last_tick_by_name: Dict[str, int] = {}
-    auto_count = 0
-    total_count = 0
-
-    for d in ev:
-        a = d.get("action", "")
-        r = d.get("reward", None)
-        try:
-            r = float(r) if r is not None else None
-        except Exception:
-            r = None
 
-        total_count += 1
-        if _is_auto(a):
-            auto_count += 1
-            auto_rewards_by_name.setdefault(a, []).append(r if isinstance(r, (int, float)) else 0.0)
-            t = d.get("tick")
-            if isinstance(t, int):
-                last_tick_by_name[a] = t
-        else:
-            if isinstance(r, (int, float)):
-                non_auto_rewards.append(r)
+    for a, r, t in ev:
+        if a is not None:
+            auto_uses[a] += 1
+            if r is not None:
+                auto_sum[a] = auto_sum.get(a, 0.0) + r
                 if r != 0.0:
-                    non_auto_nonzero += 1
-            non_auto_count += 1
-
-    baseline = _mean(non_auto_rewards)
+                    auto_nonzero[a] += 1
+            if t is not None:
+                last_tick_by_name[a] = t
+        elif r is not None:
+            non_auto_sum += r
+            non_auto_rewarded += 1
+            if r != 0.0:
+                non_auto_nonzero += 1
+
+    total_count = len(ev)
+    auto_count = sum(auto_uses.values())
+    non_auto_count = total_count - auto_count
+    baseline = (non_auto_sum / non_auto_rewarded) if non_auto_rewarded else 0.0
     nonzero_rate = (100.0 * non_auto_nonzero / non_auto_count) if non_auto_count else 0.0
     auto_pct = (100.0 * auto_count / total_count) if total_count else 0.0
 
-    per_auto: Dict[str, Any] = {}
-    for name, rs in auto_rewards_by_name.items():
-        uses = len(rs)
-        avg = _mean(rs)
-        nonzero = (100.0 * sum(1 for x in rs if isinstance(x, (int, float)) and x != 0.0) / uses) if uses else 0.0
-        per_auto[name] = {
+    per_auto: Dict[str, Any] = {
+        name: {
             "uses": uses,
-            "avg_reward": avg,
-            "nonzero_rate": nonzero,
+            "avg_reward": auto_sum.get(name, 0.0) / uses,
+            "nonzero_rate": 100.0 * auto_nonzero[name] / uses,
             "last_tick": last_tick_by_name.get(name, 0),
         }
+        for name, uses in auto_uses.items()
+    }
 
     recent = {
         "auto_skill_pct": auto_pct,
@@ -153,6 +254,7 @@ def compute_recent_metrics() -> Tuple[Dict[str, Any], Dict[str, Any]]:
         "non_auto_nonzero_rate": nonzero_rate,
         "sample_size": total_count,
     }
+    _METRICS["val"] = (recent, per_auto)
     return recent, per_auto
 
 def choose_candidate(per_auto: Dict[str, Any], baseline: float, registry: Dict[str, Any]) -> Optional[str]:
@@ -167,8 +269,8 @@ def choose_candidate(per_auto: Dict[str, Any], baseline: float, registry: Dict[s
         status = sk.get("status", "probation")
         if status != "probation":
             continue
-        n = max(1, int(stats.get("uses", 0)))
-        avg = float(stats.get("avg_reward", 0.0))
+        n = max(1, stats["uses"])  # per_auto comes typed from compute_recent_metrics
+        avg = stats["avg_reward"]
         bonus = math.sqrt(2.0 * math.log(N) / n)
         ucb = avg + bonus + (0.5 * max(0.0, avg - baseline))
         ranks.append((ucb, name))
@@ -178,20 +280,67 @@ def choose_candidate(per_auto: Dict[str, Any], baseline: float, registry: Dict[s
     ranks.sort(reverse=True)
     return ranks[0][1]
 
-def update_registry(recent: Dict[str, Any], per_auto: Dict[str, Any]) -> Dict[str, Any]:
-    reg = _load_json(REGISTRY_FILE, {})
+def _recount_statuses(reg: Dict[str, Any]) -> Dict[str, int]:
+    """Rebuild reg["counts"] from the skills table (one pass over a small dict)."""
+    counts = {"probation": 0, "active": 0, "retired": 0}
+    for sk in reg.get("skills", {}).values():
+        st = sk.get("status", "probation")
+        counts[st] = counts.get(st, 0) + 1
+    reg["counts"] = counts
+    return counts
+
+def _status_counts(reg: Dict[str, Any]) -> Dict[str, int]:
+    """reg["counts"]: skills per status, kept in step with this skill's own status changes
+    so gate checks are O(1). Rebuilt from the skills table whenever the registry is
+    (re)loaded from disk, since other skills rewrite statuses without updating it."""
+    counts = reg.get("counts")
+    if not isinstance(counts, dict):
+        counts = _recount_statuses(reg)
+    return counts
+
+def _track_status(counts: Dict[str, int], old: Optional[str], new: str) -> None:
+    if old == new:
+        return
+    if old is not None:
+        counts[old] = counts.get(old, 0) - 1
+    counts[new] = counts.get(new, 0) + 1
+
+# Gate signature and file key of our last registry write, refreshes since that write, and
+# the last refresh tick (survives another writer carrying a stale last_run_tick forward).
+_REG_FLUSH: Dict[str, Any] = {"sig": None, "key": None, "skipped": 0, "ran": -10**9}
+
+# uses per auto skill as of our last refresh. Strikes compare against this, not the file:
+# a skipped write plus a greenlight rewrite can hand back an older "uses" on reload, which
+# would count the same underperforming uses twice.
+_LAST_USES: Dict[str, int] = {}
+
+def _gate_signature(reg: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Registry fields read by generated gates (budget/candidate/status) or not rebuilt
+    from the log on the next refresh (strikes)."""
+    return (
+        reg.get("budget", {}).get("enabled"),
+        reg.get("designated_candidate"),
+        tuple((n, sk.get("status"), sk.get("strikes")) for n, sk in reg.get("skills", {}).items()),
+    )
+
+def update_registry(recent: Dict[str, Any], per_auto: Dict[str, Any], last_run_tick: Optional[int] = None) -> Dict[str, Any]:
+    reg = _load_registry_cached()
+    foreign = _REG_CACHE["key"] != _REG_FLUSH["key"]  # someone else rewrote the file since
     skills = reg.get("skills", {})
+    counts = _status_counts(reg)
 
     baseline = float(recent.get("baseline_non_auto_avg", 0.0))
 
     # Update stats and statuses
     for name, st in per_auto.items():
-        sk = skills.get(name, {"status": "probation", "strikes": 0, "q_fence": Q_FENCE_DISABLED})
-        uses = int(st.get("uses", 0))
-        avg = float(st.get("avg_reward", 0.0))
-        last_tick = int(st.get("last_tick", 0))
-
-        prev_uses = int(sk.get("uses", 0))
+        sk = skills.get(name)
+        old_status = None if sk is None else sk.get("status", "probation")
+        if sk is None:
+            sk = {"status": "probation", "strikes": 0, "q_fence": Q_FENCE_DISABLED}
+        uses, avg, last_tick = st["uses"], st["avg_reward"], st["last_tick"]  # typed per_auto
+
+        prev_uses = _LAST_USES.get(name, int(sk.get("uses", 0)))
+        _LAST_USES[name] = uses
         if uses > prev_uses and avg < baseline:
             sk["strikes"] = int(sk.get("strikes", 0)) + 1
 
@@ -211,6 +360,7 @@ def update_registry(recent: Dict[str, Any], per_auto: Dict[str, Any]) -> Dict[st
             "status": status,
         })
         skills[name] = sk
+        _track_status(counts, old_status, status)
 
     auto_pct = float(recent.get("auto_skill_pct", 0.0))
     budget_enabled = auto_pct <= BUDGET_TARGET_PCT
@@ -233,8 +383,18 @@ def update_registry(recent: Dict[str, Any], per_auto: Dict[str, Any]) -> Dict[st
         "designated_candidate": candidate,
         "skills": skills,
     })
-
-    _save_json(REGISTRY_FILE, reg)
+    if last_run_tick is not None:
+        reg["last_run_tick"] = _REG_FLUSH["ran"] = last_run_tick
+
+    # Skipped refreshes leave uses/avg_reward/baseline/auto_skill_pct/last_run_tick stale
+    # on disk (the auto_skill gates only read the signature fields, which always flush).
+    # greenlight and the seeding path rewrite the whole file from their own copy, so once
+    # the file changed under us the next refresh always writes and restores those fields.
+    sig = _gate_signature(reg)
+    _REG_FLUSH["skipped"] += 1
+    if foreign or sig != _REG_FLUSH["sig"] or _REG_FLUSH["skipped"] >= REGISTRY_FLUSH_EVERY:
+        _save_registry(reg)
+        _REG_FLUSH.update(sig=sig, key=_REG_CACHE["key"], skipped=0)
     return reg
 
 # -----------------------------------------------------------------------------
@@ -265,35 +425,38 @@ RUNTIME_GATE_TEMPLATE = (
     "\n"
     "REGISTRY_FILE = Path('data/self_coder_registry.json')\n"
     "ACT_NAME = '{skill_name}'\n"
+    "_REG = {{'key': None, 'val': {{}}}}  # parsed registry, reused while (mtime_ns, size) is unchanged\n"
     "\n"
     "def _load_registry():\n"
     "    try:\n"
-    "        return json.loads(REGISTRY_FILE.read_text())\n"
+    "        st = REGISTRY_FILE.stat()\n"
+    "        key = (st.st_mtime_ns, st.st_size)\n"
+    "        if key != _REG['key']:\n"
+    "            _REG['val'] = json.loads(REGISTRY_FILE.read_text())\n"
+    "            _REG['key'] = key\n"
+    "        return _REG['val']\n"
     "    except Exception:\n"
     "        return {{}}\n"
     "\n"
-    "def _allowed(my_name, state):\n"
+    "_EMPTY = {{}}\n"
+    "Q_FENCE = {q_fence}\n"
+    "\n"
+    "def _allowed(state):\n"
     "    reg = _load_registry()\n"
-    "    budget = reg.get('budget', {{}})\n"
-    "    if not budget.get('enabled', True):\n"
-    "        cand = reg.get('designated_candidate')\n"
-    "        sk = reg.get('skills', {{}}).get(my_name, {{}})\n"
-    "        if sk.get('status') != 'active' and my_name != cand:\n"
-    "            q = state.get('q', {{}})\n"
-    "            if ACT_NAME in q:\n"
-    "                q[ACT_NAME] = {q_fence}\n"
-    "            return False\n"
-    "    sk = reg.get('skills', {{}}).get(my_name, {{}})\n"
-    "    if sk.get('status') == 'retired':\n"
-    "        q = state.get('q', {{}})\n"
+    "    status = reg.get('skills', _EMPTY).get(ACT_NAME, _EMPTY).get('status')\n"
+    "    fenced = status == 'retired' or (\n"
+    "        status != 'active'\n"
+    "        and not reg.get('budget', _EMPTY).get('enabled', True)\n"
+    "        and reg.get('designated_candidate') != ACT_NAME)\n"
+    "    if fenced:\n"
+    "        q = state.get('q', _EMPTY)\n"
     "        if ACT_NAME in q:\n"
-    "            q[ACT_NAME] = {q_fence}\n"
-    "        return False\n"
-    "    return True\n"
+    "            q[ACT_NAME] = Q_FENCE\n"
+    "    return not fenced\n"
     "\n"
     "def act(ctx):\n"
     "    s = ctx['state']\n"
-    "    if not _allowed(ACT_NAME, s):\n"
+    "    if not _allowed(s):\n"
     "        return 0.0\n"
     "\n"
     "{body}\n"
@@ -347,12 +510,20 @@ def generate_skill_code(need: Dict[str, Any], skill_number: int) -> Tuple[str, s
 # -----------------------------------------------------------------------------
 
 def _can_generate_today(gen_log: Dict[str, Any]) -> bool:
+    # "generated" is appended in time order: walk back from the newest entry and stop at the
+    # first one older than a day, or once the cap is reached (at most MAX_SKILLS_PER_DAY steps).
     day_ago = _now() - 86400.0
-    recent = [g for g in gen_log.get("generated", []) if g.get("timestamp", 0) > day_ago]
-    return len(recent) < MAX_SKILLS_PER_DAY
+    recent = 0
+    for g in reversed(gen_log.get("generated", [])):
+        if g.get("timestamp", 0) <= day_ago:
+            break
+        recent += 1
+        if recent >= MAX_SKILLS_PER_DAY:
+            return False
+    return True
 
 def _probation_count(registry: Dict[str, Any]) -> int:
-    return sum(1 for sk in registry.get("skills", {}).values() if sk.get("status", "probation") == "probation")
+    return _status_counts(registry).get("probation", 0)
 
 # -----------------------------------------------------------------------------
 # Main action
@@ -363,16 +534,14 @@ def act(ctx: Dict[str, Any]) -> float:
     ticks = int(s.get("ticks", 0))
 
     # Throttle heavy work
-    registry = _load_json(REGISTRY_FILE, {})
-    last_run_tick = int(registry.get("last_run_tick", -10**9))
+    registry = _load_registry_cached()
+    last_run_tick = max(int(registry.get("last_run_tick", -10**9)), _REG_FLUSH["ran"])
     if ticks - last_run_tick < TICK_COOLDOWN:
         return 0.0
 
     # Refresh metrics & registry
     recent, per_auto = compute_recent_metrics()
-    registry = update_registry(recent, per_auto)
-    registry["last_run_tick"] = ticks
-    _save_json(REGISTRY_FILE, registry)
+    registry = update_registry(recent, per_auto, last_run_tick=ticks)  # one registry write
 
     # Budget check: if over target and no candidate burst, skip spawn
     budget = registry.get("budget", {})
@@ -413,6 +582,8 @@ def act(ctx: Dict[str, Any]) -> float:
 
         # Seed registry entry for probation
         skills = registry.setdefault("skills", {})
+        prev = skills.get(skill_name)
+        _track_status(_status_counts(registry), None if prev is None else prev.get("status", "probation"), "probation")
         skills[skill_name] = {
             "status": "probation",
             "uses": 0,
@@ -421,7 +592,7 @@ def act(ctx: Dict[str, Any]) -> float:
             "q_fence": Q_FENCE_DISABLED,
             "last_tick": ticks,
         }
-        _save_json(REGISTRY_FILE, registry)
+        _save_registry(registry)
 
         # Note for visibility
         notes = s.setdefault("notes", [])
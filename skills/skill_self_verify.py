@@ -1,8 +1,12 @@
 from pathlib import Path
-import tempfile, zipfile, hashlib, json, time, shutil
+import zipfile, hashlib, json, time
 ACT_NAME = "self_verify"
 FORCE_FLAG = Path("data/force/verify.force")
 THROTTLE_TICKS = 180
+# Bundles are immutable once renamed into place, so a verified (path, mtime, size) never
+# needs re-checking. Persisted so restarts keep it; only the newest entries are kept.
+VERIFY_CACHE = Path("data/verify_cache.json")
+VERIFY_CACHE_KEEP = 16
 
 def _consume_force_flag() -> bool:
     if FORCE_FLAG.exists():
@@ -11,12 +15,37 @@ def _consume_force_flag() -> bool:
         return True
     return False
 
-def _sha256_file(p: Path) -> str:
+HASH_CHUNK = 4 * 1024 * 1024
+# One reusable read buffer (skills run one at a time on the main loop): readinto()
+# fills it in place, so hashing allocates nothing per chunk.
+_HASH_BUF = bytearray(HASH_CHUNK)
+_HASH_MV = memoryview(_HASH_BUF)
+
+def _sha256_stream(f) -> str:
     h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024*1024), b""): h.update(chunk)
+    while n := f.readinto(_HASH_BUF): h.update(_HASH_MV[:n])
     return h.hexdigest()
 
+def _bundle_key(bundle: Path) -> str:
+    st = bundle.stat()
+    return f"{bundle}:{st.st_mtime_ns}:{st.st_size}"
+
+def _load_verified() -> dict:
+    try: d = json.loads(VERIFY_CACHE.read_text(encoding="utf-8"))
+    except Exception: return {}
+    return d if isinstance(d, dict) else {}
+
+def _remember_verified(cache: dict, key: str) -> None:
+    cache.pop(key, None); cache[key] = {"ok": True, "verified_at": time.time()}
+    for old in list(cache)[:-VERIFY_CACHE_KEEP]: del cache[old]  # dicts keep insertion order
+    tmp = VERIFY_CACHE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8"); tmp.replace(VERIFY_CACHE)
+
+def _mark_verified(s: dict, bundle: Path) -> float:
+    s["last_verify_bundle"] = str(bundle)
+    s["last_verify_ts"] = time.strftime("%Y%m%d-%H%M%S", time.localtime())
+    return +0.7
+
 def _newest_bundle(release_dir: Path) -> Path | None:
     zips = sorted(release_dir.glob("fgseed-*.zip"), key=lambda p: p.stat().st_mtime, reverse=True)
     return zips[0] if zips else None
@@ -28,29 +57,29 @@ def act(ctx):
 
     release_dir = Path("data") / "releases"; bundle = _newest_bundle(release_dir)
     if not bundle or not bundle.exists(): return 0.0
+    try: key = _bundle_key(bundle)
+    except OSError: return 0.0
+    verified = _load_verified()
+    if not forced and key in verified: return _mark_verified(s, bundle)  # unchanged bundle: nothing to re-extract
 
-    tmpdir = Path(tempfile.mkdtemp(prefix="fgseed-verify-"))
+    # Hash entries straight out of the archive: nothing is extracted to disk. Reading an
+    # entry to EOF also checks its CRC-32 (BadZipFile on mismatch), which is what testzip() did.
     try:
         with zipfile.ZipFile(bundle, "r") as zf:
-            if zf.testzip() is not None: return -0.5
-            zf.extractall(tmpdir)
-
-        mpath = tmpdir / "manifest.json"
-        if not mpath.exists(): return -0.5
-        data = json.loads(mpath.read_text(encoding="utf-8"))
-        for e in data.get("files", []):
-            rel = e.get("path"); expect = e.get("sha256")
-            if not rel or not expect: return -0.5
-            fp = tmpdir / rel
-            if fp.is_file():
-                if _sha256_file(fp) != expect: return -0.5
-            else:
-                if not fp.exists(): return -0.5
-
-        s["last_verify_bundle"] = str(bundle)
-        s["last_verify_ts"] = time.strftime("%Y%m%d-%H%M%S", time.localtime())
-        return +0.7
+            names = set(zf.namelist())
+            if "manifest.json" not in names: return -0.5
+            data = json.loads(zf.read("manifest.json").decode("utf-8"))
+            for e in data.get("files", []):
+                rel = e.get("path"); expect = e.get("sha256")
+                if not rel or not expect: return -0.5
+                if rel in names:
+                    with zf.open(rel) as zi:
+                        if _sha256_stream(zi) != expect: return -0.5
+                elif not any(n.startswith(rel.rstrip("/") + "/") for n in names):
+                    return -0.5  # neither a file nor a directory in the bundle
+
+        try: _remember_verified(verified, key)  # also refreshes verified_at after a forced run
+        except Exception: pass  # cache is an optimisation only
+        return _mark_verified(s, bundle)
     except Exception:
         return -0.5
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
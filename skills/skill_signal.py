@@ -1,13 +1,37 @@
 # Seed-0 skill: signal - Raw state projection
 # Guy outputs its actual internal state changes, no fake philosophy
 from pathlib import Path
+import atexit
 import json
+import os
 import time
 
 ACT_NAME = "signal"
 SIGNAL_FILE = Path("data/signal.jsonl")
 THROTTLE_SECS = 60  # 1 minute
 
+# Append handle kept open across calls (no open/close per signal). Each line is
+# flushed as it is written so readers never see a partial record.
+_SIG_FH = None
+
+def _signal_fh():
+    global _SIG_FH
+    fh = _SIG_FH
+    if fh is not None:
+        try:
+            if os.fstat(fh.fileno()).st_nlink > 0:
+                return fh
+        except OSError:
+            pass
+        fh.close()  # file was removed/rotated underneath us; reopen by name
+    _SIG_FH = SIGNAL_FILE.open("ab")
+    return _SIG_FH
+
+@atexit.register
+def _close_signal_fh():
+    if _SIG_FH is not None:
+        _SIG_FH.close()
+
 def act(ctx):
     s = ctx["state"]
     now = time.time()
@@ -29,8 +53,9 @@ def act(ctx):
     }
     
     # Just dump the raw data
-    with SIGNAL_FILE.open("a") as f:
-        f.write(json.dumps(signal) + "\n")
+    fh = _signal_fh()
+    fh.write(json.dumps(signal).encode() + b"\n")
+    fh.flush()
     
     s["last_signal_ts"] = now
     
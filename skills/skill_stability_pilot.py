@@ -13,8 +13,10 @@
 # Drop-in: save to skills/, core will hot-reload automatically.
 
 from pathlib import Path
-from collections import deque, Counter
+from collections import Counter
+from itertools import groupby, islice
 import json, time, math
+from skills._logtail import TICK_MARK, iter_lines_reversed
 
 ACT_NAME = "stability_pilot"
 
@@ -35,41 +37,48 @@ Q_MAX_ABS      = 1.0     # clamp Q into [-1, 1]
 BURST_TICKS    = 90      # duration to favor variety after correction
 DREAM_BIAS_WIN = 180     # seconds to next dream when we lift its Q a bit
 DREAM_Q_LIFT   = 0.05    # temporary lift target for dream
+TAIL_CHUNK     = 128 * 1024  # bytes per backwards read when tailing the log
 
 def _tail_actions(path: Path, want: int):
-    evts = deque(maxlen=want * 2)
-    if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                e = json.loads(line)
-            except Exception:
-                continue
-            if e.get("kind") == "tick":
-                a = e.get("action")
-                if a:
-                    evts.append(a)
-    return list(evts)[-want:]
-
-def _longest_streak(seq):
-    if not seq:
-        return 0
-    best = 1
-    cur = 1
-    prev = seq[0]
-    for a in seq[1:]:
-        if a == prev:
-            cur += 1
-            if cur > best:
-                best = cur
-        else:
-            cur = 1
-            prev = a
-    return best
-
-def _normalized_entropy(counter: Counter) -> float:
-    total = sum(counter.values())
+    """Actions of the last `want` tick events, oldest first; reads only as far back as needed."""
+    acts = []
+    for line in iter_lines_reversed(path, TAIL_CHUNK):
+        if TICK_MARK not in line:
+            continue  # not a tick event; skip the JSON parse
+        try:
+            e = json.loads(line)
+        except Exception:
+            continue
+        if e.get("kind") == "tick":
+            a = e.get("action")
+            if a:
+                acts.append(a)
+                if len(acts) >= want:
+                    break
+    acts.reverse()
+    return acts
+
+def _window_actions(ctx, want: int):
+    """Last `want` actions: from main.py's in-memory ring when it already holds that many
+    (no file I/O), otherwise from the log tail (e.g. right after a restart)."""
+    ring = ctx.get("recent_actions")
+    if ring is not None and len(ring) >= want:
+        return list(islice(ring, len(ring) - want, None))
+    return _tail_actions(LOG_PATH, want)
+
+def _analyze(seq):
+    """One pass over runs of equal actions -> (Counter of actions, longest streak).
+    groupby walks each run in C, so Python only steps once per run, not per element."""
+    cnt = Counter()
+    best = 0
+    for a, run in groupby(seq):
+        n = len(list(run))
+        cnt[a] += n
+        if n > best:
+            best = n
+    return cnt, best
+
+def _normalized_entropy(counter: Counter, total: int) -> float:
     k = len(counter)
     if total <= 0 or k <= 1:
         return 0.0
@@ -94,7 +103,7 @@ def act(ctx):
     if ticks % RUN_EVERY != 0:
         return 0.0
 
-    actions = _tail_actions(LOG_PATH, WINDOW_TICKS)
+    actions = _window_actions(ctx, WINDOW_TICKS)
     total = len(actions)
 
     # Keep epsilon in a safe band
@@ -104,13 +113,13 @@ def act(ctx):
 
     q = s.setdefault("q", {})
     corrected = False
+    touched = set()  # Q keys written this call; only these need clamping
 
     if total >= MIN_SAMPLE:
-        cnt = Counter(actions)
+        cnt, streak = _analyze(actions)
         (top, topc) = cnt.most_common(1)[0]
         frac = topc / total
-        streak = _longest_streak(actions)
-        h_norm = _normalized_entropy(cnt)
+        h_norm = _normalized_entropy(cnt, total)
 
         stuck = (frac >= DOM_FRAC) or (streak >= STREAK_MAX) or (h_norm < ENTROPY_LOW)
 
@@ -120,10 +129,12 @@ def act(ctx):
             # Damp dominant action Q so others get a chance
             if top in q:
                 q[top] = float(q.get(top, 0.0)) * Q_DAMP
+                touched.add(top)
             # Raise underused actions to a soft floor
             for a in cnt:
                 if a != top and float(q.get(a, 0.0)) < Q_SOFT_FLOOR:
                     q[a] = Q_SOFT_FLOOR
+                    touched.add(a)
             # Begin short burst window
             s["stability_burst_until"] = ticks + BURST_TICKS
             corrected = True
@@ -137,17 +148,20 @@ def act(ctx):
             dq = float(q.get("dream", 0.0))
             if dq < DREAM_Q_LIFT:
                 q["dream"] = DREAM_Q_LIFT
+                touched.add("dream")
 
         # During burst window, keep a mild preference for a couple of alternatives
         burst_until = int(s.get("stability_burst_until", 0))
         if ticks < burst_until:
             # Favor non-dominant, non-heartbeat actions mildly
-            for a in list(q.keys()):
-                if a not in ("heartbeat", top):
-                    q[a] = max(float(q.get(a, 0.0)), Q_SOFT_FLOOR)
+            for a, v in q.items():
+                if v < Q_SOFT_FLOOR and a not in ("heartbeat", top):
+                    q[a] = Q_SOFT_FLOOR
+                    touched.add(a)
 
-        # Clamp Q-values
-        for k, v in list(q.items()):
+        # Clamp only the Q-values written above (the rest of q is untouched by this skill)
+        for k in touched:
+            v = q[k]
             if v > Q_MAX_ABS:
                 q[k] = Q_MAX_ABS
             elif v < -Q_MAX_ABS:
@@ -1,8 +1,9 @@
 # Survival reflexes: reduce suffocation risk & water pinning by preferring 'wolf_unstuck'
 # Safe: local state only. No OS/network. Runs periodically and adjusts Q-values + epsilon.
-from collections import Counter, deque
+from itertools import islice
 from pathlib import Path
 import json
+from skills._logtail import TICK_MARK, iter_lines_reversed
 
 ACT_NAME = "survival_reflexes"
 RUN_EVERY = 50          # check every 50 ticks
@@ -12,20 +13,29 @@ LOW_Q = 0.002           # treat wolf_actions as weak if below this
 EPS_BUMP = 0.04         # exploration bump on risk
 EPS_CAP = 0.35
 DAMP = 0.90             # multiply risky action Q by this
+TAIL_CHUNK = 64 * 1024  # bytes per backwards read; SEQ_WINDOW ticks fit in one or two
 
-def _recent_actions():
-    # Prefer Guy's JSON event stream if present; fall back to state history
-    p = Path("data/events.log")
-    acts = deque(maxlen=SEQ_WINDOW)
-    if p.exists():
-        for line in p.open("r", encoding="utf-8"):
-            try:
-                e = json.loads(line)
-                if e.get("kind") == "tick" and "action" in e:
-                    acts.append(e["action"])
-            except Exception:
-                pass
-    return list(acts)
+def _recent_actions(ctx=None):
+    # Prefer main.py's in-memory action ring once it covers the window (no file I/O),
+    # then Guy's JSON event stream; the caller falls back to state history.
+    ring = (ctx or {}).get("recent_actions")
+    if ring is not None and len(ring) >= SEQ_WINDOW:
+        return list(islice(ring, len(ring) - SEQ_WINDOW, None))
+    # Only the last SEQ_WINDOW ticks matter, so read the log from the end.
+    acts = []
+    for line in iter_lines_reversed(Path("data/events.log"), TAIL_CHUNK):
+        if TICK_MARK not in line:
+            continue  # not a tick event; skip the JSON parse
+        try:
+            e = json.loads(line)
+            if e.get("kind") == "tick" and "action" in e:
+                acts.append(e["action"])
+                if len(acts) >= SEQ_WINDOW:
+                    break
+        except Exception:
+            pass
+    acts.reverse()
+    return acts
 
 def act(ctx):
     s = ctx["state"]
@@ -35,9 +45,9 @@ def act(ctx):
 
     q = s.setdefault("q", {})
     eps = float(s.get("epsilon", 0.2))
-    recent = _recent_actions() or list(s.get("last_actions", []))[-SEQ_WINDOW:]
-    c = Counter(recent)
-    wolf_repeats = c.get("wolf_actions", 0)
+    recent = _recent_actions(ctx) or [e.get("action") for e in s.get("last_actions", [])[-SEQ_WINDOW:]]
+    # Only one action's frequency matters: list.count runs in C, no Counter dict needed
+    wolf_repeats = recent.count("wolf_actions")
 
     # Heuristic: risky if wolf_actions repeats a lot OR its Q has gone low/negative
     risky = (wolf_repeats >= MIN_REPEAT) or (q.get("wolf_actions", 0.0) <= LOW_Q)
@@ -70,9 +80,11 @@ def act(ctx):
 
         reward = 0.02  # reinforce safety behavior
 
-    # Bound Q-values
-    for k,v in list(q.items()):
-        if v > 1.0: q[k] = 1.0
-        if v < -1.0: q[k] = -1.0
+        # Bound the Q-values written above (the rest of q is untouched by this skill)
+        for k in ("wolf_unstuck", "wolf_actions"):
+            v = q.get(k)
+            if v is None: continue
+            if v > 1.0: q[k] = 1.0
+            elif v < -1.0: q[k] = -1.0
 
     return reward
@@ -5,27 +5,43 @@ and reward integration for Ghost (the wolf).
 """
 
 from pathlib import Path
-import json, random, time
+import json, os, random, time
+
+from skills import _wolf_io
 
 ACT_NAME = "wolf_actions"
-OUTBOX = Path("data/outbox")
-INBOX = Path(__file__).resolve().parents[1] / "data" / "inbox.txt"
+# Absolute, like the other wolf skills' paths, so all share one _wolf_io handle per file
+OUTBOX = Path(__file__).resolve().parents[1] / "data" / "outbox"
+INBOX = OUTBOX.parent / "inbox.txt"
 OUTBOX.mkdir(parents=True, exist_ok=True)
 
+# Outbox events go to one shared append-only JSONL (one line per event) instead of a
+# file per tick. The handle stays open across calls; each act() emits one event and
+# flushes it, so the whole line reaches the file in one write() on the same tick.
+OUT_LOG = OUTBOX / "events.jsonl"
+_REWARD_LINE = b"reward wolf_actions +0.01\n"
+
+WOLF_ACTIONS = ("guard", "patrol", "idle", "follow", "attack", "howl")
+
+def _emit(payload):
+    fh = _wolf_io.out_fh(OUT_LOG)
+    fh.write(json.dumps(payload, separators=(",", ":")).encode() + b"\n")
+    fh.flush()
+
 
 def act(ctx):
     state = ctx.get("state", {})
     q_values = ctx.get("q_values", {})
 
-    wolf_actions = ["guard", "patrol", "idle", "follow", "attack", "howl"]
-
     # Exploration–exploitation tradeoff
     epsilon = float(state.get("epsilon", 0.3))
     if random.random() < epsilon:
-        action = random.choice(wolf_actions)
+        action = random.choice(WOLF_ACTIONS)
         mode = "explore"
     else:
-        action = max(wolf_actions, key=lambda a: q_values.get(a, 0.0))
+        # argmax without a per-item lambda; index() keeps max()'s first-wins tie-break
+        qs = [q_values.get(a, 0.0) for a in WOLF_ACTIONS]
+        action = WOLF_ACTIONS[qs.index(max(qs))]
         mode = "exploit"
 
     # Build structured outbox message
@@ -39,16 +55,14 @@ def act(ctx):
         "q_value": q_values.get(action, 0.0),
     }
 
-    # Write JSON log to outbox
-    out_file = OUTBOX / f"wolf-{int(msg['ts'])}.json"
-    out_file.write_text(json.dumps(msg, indent=2))
+    # Append JSON log line to the outbox event log
+    _emit(msg)
 
     # Also update simple flag file for external bridge
     (OUTBOX / "wolf_action.txt").write_text(action)
 
     # Emit reward hint into inbox for Ghost integration
-    with INBOX.open("a") as f:
-        f.write("reward wolf_actions +0.01\n")
+    os.write(_wolf_io.inbox_fd(INBOX), _REWARD_LINE)
 
     # Small baseline return so Guy’s Q loop sees it
     return 0.01
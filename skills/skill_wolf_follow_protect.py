@@ -5,7 +5,7 @@ Goal : Keep close to owner even when it's unsafe (caves/dark/threats),
        injects short patrol "jiggles" when stuck, escalates to guard/attack and
        battle howl if threats are detected.
 
-I/O   : Emits GuyBridge outbox JSON events:
+I/O   : Appends GuyBridge outbox JSON events to data/outbox/events.jsonl:
           - {"action":"wolf_actions","wolf_action":"follow","target":"owner"}
           - {"action":"wolf_actions","wolf_action":"patrol","pattern":"arc_left","radius":2,"duration_s":2}
           - {"action":"wolf_actions","wolf_action":"guard"}
@@ -27,9 +27,11 @@ If fields are missing, defaults are used.
 """
 
 from __future__ import annotations
-import json, time, random
+import json, os, time, random
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict
+
+from skills import _wolf_io
 
 NAME = "wolf_follow_protect"
 
@@ -42,39 +44,30 @@ def _root() -> Path:
         here = here.parent
     return Path.cwd()
 
-def _outbox() -> Path:
-    p = _root() / "data" / "outbox"
-    p.mkdir(parents=True, exist_ok=True)
-    return p
-
-def _inbox() -> Path:
-    _root().mkdir(parents=True, exist_ok=True)
-    ib = _root() / "data" / "inbox.txt"
-    if not ib.exists():
-        ib.touch()
-    return ib
-
-def _state_path() -> Path:
-    return _root() / "data" / "wolf_follow_protect_state.json"
+# Resolved once at import (the parent walk costs up to 6 stat calls); the module is
+# re-imported by the loader whenever this file changes.
+_ROOT = _root()
+OUT_LOG = _ROOT / "data" / "outbox" / "events.jsonl"
+INBOX = _ROOT / "data" / "inbox.txt"  # opened with O_CREAT, so it may not exist yet
+_STATE_PATH = _ROOT / "data" / "wolf_follow_protect_state.json"
+OUT_LOG.parent.mkdir(parents=True, exist_ok=True)
 
 # ---------- State ----------
+# Cached by skills/_wolf_io.py, which outlives hot reloads of this file and flushes at exit.
 def _load_state() -> Dict[str, Any]:
-    sp = _state_path()
-    if sp.exists():
-        try:
-            return json.loads(sp.read_text())
-        except Exception:
-            return {}
-    return {}
+    return _wolf_io.load_state(_STATE_PATH)
 
-def _save_state(s: Dict[str, Any]):
-    _state_path().write_text(json.dumps(s, indent=2))
+def _save_state(s: Dict[str, Any]) -> None:
+    _wolf_io.save_state(_STATE_PATH, s)
 
+# ---------- Outbox ----------
+# One shared append-only JSONL instead of a file per event. The handle stays open;
+# events of one act() call are buffered and flushed together at its end.
 def _emit(payload: Dict[str, Any]):
-    ts = int(time.time())
-    fn = _outbox() / f"{('howl' if payload.get('action')=='wolf_howl' else 'action')}-{ts}.json"
-    with fn.open("w") as f:
-        json.dump(payload, f, separators=(",", ":"), ensure_ascii=False)
+    _wolf_io.out_fh(OUT_LOG).write(json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode() + b"\n")
+
+def _flush():
+    _wolf_io.out_fh(OUT_LOG).flush()
 
 # ---------- Policy ----------
 def _danger_score(ctx: Dict[str, Any]) -> float:
@@ -105,6 +98,7 @@ def act(ctx: Dict[str, Any]) -> float:
     Returns a tiny intrinsic reward; external rewards should be appended via inbox by the bridge/game.
     """
     now = time.time()
+    now_i = int(now)  # one timestamp for every event of this call
     s = _load_state()
     last_ts = float(s.get("last_ts", 0))
     last_follow = float(s.get("last_follow_ts", 0))
@@ -126,16 +120,16 @@ def act(ctx: Dict[str, Any]) -> float:
         # Battle howl (signal pack) with guard/attack depending on hostiles
         hostiles = int(ctx.get("hostiles_nearby", 0))
         if (now - float(s.get("last_howl_ts", 0))) > cd_howl:
-            _emit({"protocol":"guy.v1","action":"wolf_howl","howl":"battle","tick":int(now)})
+            _emit({"protocol":"guy.v1","action":"wolf_howl","howl":"battle","tick":now_i})
             s["last_howl_ts"] = now
         action = "attack" if hostiles >= 2 or ctx.get("owner_under_attack") else "guard"
-        _emit({"protocol":"guy.v1","action":"wolf_actions","wolf_action":action,"tick":int(now)})
+        _emit({"protocol":"guy.v1","action":"wolf_actions","wolf_action":action,"tick":now_i})
         emitted = True
         reward += 0.03
 
     # 2) Keep follow sticky (natural re-path) if not close enough
     if (now - last_follow) > cd_follow and owner_dist > 2.2:
-        _emit({"protocol":"guy.v1","action":"wolf_actions","wolf_action":"follow","target":"owner","tick":int(now)})
+        _emit({"protocol":"guy.v1","action":"wolf_actions","wolf_action":"follow","target":"owner","tick":now_i})
         s["last_follow_ts"] = now
         emitted = True
         # Small intrinsic reward to bias following
@@ -143,20 +137,18 @@ def act(ctx: Dict[str, Any]) -> float:
 
     # 3) If progress seems stagnant or recently stuck, insert a tiny patrol jiggle (no teleport)
     if (now - float(s.get("last_patrol_ts", 0))) > cd_patrol and _should_patrol_jiggle(ctx, s):
-        _emit({"protocol":"guy.v1","action":"wolf_actions","wolf_action":"patrol","pattern":"arc_left","radius":2,"duration_s":2,"tick":int(now)})
+        _emit({"protocol":"guy.v1","action":"wolf_actions","wolf_action":"patrol","pattern":"arc_left","radius":2,"duration_s":2,"tick":now_i})
         s["last_patrol_ts"] = now
         emitted = True
         reward += 0.02
 
     if emitted:
+        _flush()
         s["last_ts"] = now
         _save_state(s)
-        try:
-            _inbox().write_text(f"reward {NAME} +{reward:.2f}\n", append=True)  # type: ignore
-        except TypeError:
-            # Python <3.11 Path.write_text has no append; fall back:
-            with _inbox().open("a") as f:
-                f.write(f"reward {NAME} +{reward:.2f}\n")
+        # One reward line per call, however many events it emitted. It must land this
+        # tick: main.py credits inbox rewards to the acting skill only on the same tick.
+        os.write(_wolf_io.inbox_fd(INBOX), f"reward {NAME} +{reward:.2f}\n".encode())
         return reward
 
     # Nothing to do this tick
@@ -1,7 +1,7 @@
 """
 Wolf Howl Skill for Guy (AAA-grade)
 - Chooses howl type (lonely / battle / play) from current state.
-- Emits structured JSON to outbox for observability.
+- Appends structured JSON lines to data/outbox/events.jsonl for observability.
 - Writes a bridge file for server-side listeners (pack spawner).
 - Appends a reward hint into Guy's inbox for reinforcement learning.
 - Cooldown + anti-spam with tiny persisted state.
@@ -23,8 +23,10 @@ Priority: BATTLE > LONELY > PLAY (only one howl per invocation).
 from __future__ import annotations
 
 from pathlib import Path
-import json, time, random
-from typing import Dict, Any, Tuple
+import json, os, time, random
+from typing import Any, Dict, Tuple
+
+from skills import _wolf_io
 
 ACT_NAME = "wolf_howl"
 
@@ -40,6 +42,10 @@ TMP.mkdir(parents=True, exist_ok=True)
 
 STATE_FILE = TMP / "wolf_howl_state.json"
 
+# Shared append-only outbox event log (one JSON line per event), kept open across
+# calls; each act() emits exactly one event and flushes it before returning.
+OUT_LOG = OUTBOX / "events.jsonl"
+
 # Cooldowns per howl type (seconds)
 COOLDOWN = {
     "battle": 60,   # allow quicker re-calls in danger
@@ -50,19 +56,18 @@ COOLDOWN = {
 def _now() -> float:
     return time.time()
 
+# Cooldown state is cached by skills/_wolf_io.py, which outlives hot reloads of this
+# file and flushes at exit.
 def _read_state() -> Dict[str, Any]:
-    if STATE_FILE.exists():
-        try:
-            return json.loads(STATE_FILE.read_text() or "{}")
-        except Exception:
-            return {}
-    return {}
+    return _wolf_io.load_state(STATE_FILE)
 
 def _write_state(d: Dict[str, Any]) -> None:
-    try:
-        STATE_FILE.write_text(json.dumps(d, indent=2))
-    except Exception:
-        pass
+    _wolf_io.save_state(STATE_FILE, d)
+
+def _emit(msg: Dict[str, Any]) -> None:
+    fh = _wolf_io.out_fh(OUT_LOG)
+    fh.write(json.dumps(msg, separators=(",", ":")).encode() + b"\n")
+    fh.flush()
 
 def _cooldown_ok(howl_type: str, now_ts: float, st: Dict[str, Any]) -> Tuple[bool, float]:
     last_ts = st.get("last_ts", 0)
@@ -73,20 +78,21 @@ def _cooldown_ok(howl_type: str, now_ts: float, st: Dict[str, Any]) -> Tuple[boo
     remaining = max(0.0, required - (now_ts - last_ts))
     return (remaining <= 0.0), remaining
 
+# Rule constants, built once
+_NIGHTISH = frozenset(("night", "dusk", "evening"))
+_DAYLIGHT = frozenset(("day", "dawn", "morning"))
+_SAD_MOODS = frozenset(("sad", "lonely"))
+PLAY_PROB = 0.07  # rare by design
+
 def _choose_howl(state: Dict[str, Any]) -> Tuple[str|None, Dict[str, Any]]:
     reasons = {}
-    owner_absent = int(state.get("owner_absent_secs", 0))
-    nearby_hostiles = int(state.get("nearby_hostiles", 0))
-    wolf_hp = float(state.get("wolf_health_pct", 100.0))
-    owner_under_attack = bool(state.get("owner_under_attack", False))
-    tod = str(state.get("time_of_day", "day")).lower()
-    mood = str(state.get("mood", "neutral")).lower()
-    nearby_wolves = int(state.get("nearby_wolves", 0))
-    safe = bool(state.get("safe", True))
-
-    # --- Battle Howl (highest priority)
-    battle = (nearby_hostiles >= 3) or (wolf_hp < 50.0) or owner_under_attack
-    if battle:
+    get = state.get
+
+    # --- Battle Howl (highest priority); only its three fields are read before it fires
+    nearby_hostiles = int(get("nearby_hostiles", 0))
+    wolf_hp = float(get("wolf_health_pct", 100.0))
+    owner_under_attack = bool(get("owner_under_attack", False))
+    if (nearby_hostiles >= 3) or (wolf_hp < 50.0) or owner_under_attack:
         reasons["battle"] = {
             "nearby_hostiles": nearby_hostiles,
             "wolf_health_pct": wolf_hp,
@@ -94,33 +100,36 @@ def _choose_howl(state: Dict[str, Any]) -> Tuple[str|None, Dict[str, Any]]:
         }
         return "battle", reasons
 
+    tod = str(get("time_of_day", "day")).lower()
+    mood = str(get("mood", "neutral")).lower()
+
     # --- Lonely Howl
-    nightish = tod in {"night", "dusk", "evening"}
-    mood_bonus = 0.15 if mood in {"sad", "lonely"} else 0.05
-    lonely_prob = 0.10 + mood_bonus  # ~10–25% chance when conditions met
-    lonely_conditions = (owner_absent >= 600) and (nearby_wolves == 0) and nightish
-    if lonely_conditions and random.random() < lonely_prob:
-        reasons["lonely"] = {
-            "owner_absent_secs": owner_absent,
-            "nearby_wolves": nearby_wolves,
-            "time_of_day": tod,
-            "mood": mood,
-            "roll_under": lonely_prob
-        }
-        return "lonely", reasons
+    if tod in _NIGHTISH:
+        owner_absent = int(get("owner_absent_secs", 0))
+        nearby_wolves = int(get("nearby_wolves", 0))
+        if owner_absent >= 600 and nearby_wolves == 0:
+            lonely_prob = 0.10 + (0.15 if mood in _SAD_MOODS else 0.05)  # ~10–25% chance
+            if random.random() < lonely_prob:
+                reasons["lonely"] = {
+                    "owner_absent_secs": owner_absent,
+                    "nearby_wolves": nearby_wolves,
+                    "time_of_day": tod,
+                    "mood": mood,
+                    "roll_under": lonely_prob
+                }
+                return "lonely", reasons
 
     # --- Play Howl (rarest)
-    happy = (mood == "happy")
-    daylight = tod in {"day", "dawn", "morning"}
-    play_prob = 0.07  # rare by design
-    if happy and daylight and safe and random.random() < play_prob:
-        reasons["play"] = {
-            "mood": mood,
-            "time_of_day": tod,
-            "safe": safe,
-            "roll_under": play_prob
-        }
-        return "play", reasons
+    if mood == "happy" and tod in _DAYLIGHT:
+        safe = bool(get("safe", True))
+        if safe and random.random() < PLAY_PROB:
+            reasons["play"] = {
+                "mood": mood,
+                "time_of_day": tod,
+                "safe": safe,
+                "roll_under": PLAY_PROB
+            }
+            return "play", reasons
 
     return None, reasons
 
@@ -141,7 +150,7 @@ def act(ctx: Dict[str, Any]) -> float:
             "reason": rule_reasons,
             "note": "no_howl",
         }
-        (OUTBOX / f"howl-{int(ts)}.json").write_text(json.dumps(msg, indent=2))
+        _emit(msg)
         return 0.005  # tiny baseline so the scheduler doesn't starve this skill
 
     # Cooldown check
@@ -157,7 +166,7 @@ def act(ctx: Dict[str, Any]) -> float:
             "cooldown_applied": True,
             "cooldown_remaining_s": round(remaining, 2),
         }
-        (OUTBOX / f"howl-{int(ts)}.json").write_text(json.dumps(msg, indent=2))
+        _emit(msg)
         return 0.003  # slight penalty to discourage spamming paths
 
     # We will howl 🎵
@@ -171,15 +180,14 @@ def act(ctx: Dict[str, Any]) -> float:
     }
 
     # Write structured outbox event
-    (OUTBOX / f"howl-{int(ts)}.json").write_text(json.dumps(msg, indent=2))
+    _emit(msg)
 
     # Bridge file for the server plugin (read & react)
     (OUTBOX / "wolf_howl.txt").write_text(howl_type)
 
     # Reward hint for RL loop (slightly higher than wolf_actions baseline)
     try:
-        with INBOX.open("a") as f:
-            f.write(f"reward ghost_howl_{howl_type} +0.02\n")
+        os.write(_wolf_io.inbox_fd(INBOX), f"reward ghost_howl_{howl_type} +0.02\n".encode())
     except Exception:
         # Best-effort; don't crash the skill
         pass
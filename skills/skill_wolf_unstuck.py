@@ -2,13 +2,15 @@
 Skill: wolf_unstuck
 Purpose: Reduce pathing stalls with natural movement (no teleport).
 Strategy: Occasionally issue a short patrol arc, then re-issue follow.
-Outputs: JSON files to data/outbox/ using Guy protocol (wolf_actions).
+Outputs: JSON lines appended to data/outbox/events.jsonl using Guy protocol (wolf_actions).
 """
 
 from __future__ import annotations
 import json, time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict
+
+from skills import _wolf_io
 
 ACT_NAME = "wolf_unstuck"
 
@@ -22,32 +24,26 @@ def _project_root() -> Path:
     # Fallback to CWD/data
     return Path.cwd()
 
-def _outbox() -> Path:
-    root = _project_root()
-    out = root / "data" / "outbox"
-    out.mkdir(parents=True, exist_ok=True)
-    return out
-
-def _state_file() -> Path:
-    return _project_root() / "data" / "wolf_unstuck_state.json"
+# Resolved once per import, not per call; the loader re-imports on file change
+_ROOT = _project_root()
+_OUTBOX_DIR = _ROOT / "data" / "outbox"
+_STATE_FILE = _ROOT / "data" / "wolf_unstuck_state.json"
+OUT_LOG = _OUTBOX_DIR / "events.jsonl"
 
+# State is cached by skills/_wolf_io.py, which outlives hot reloads of this file and
+# flushes at exit.
 def _load_state() -> Dict[str, Any]:
-    sf = _state_file()
-    if sf.exists():
-        try:
-            return json.loads(sf.read_text())
-        except Exception:
-            return {}
-    return {}
+    return _wolf_io.load_state(_STATE_FILE)
 
 def _save_state(s: Dict[str, Any]) -> None:
-    _state_file().write_text(json.dumps(s, indent=2))
+    _wolf_io.save_state(_STATE_FILE, s)
 
+# Shared append-only outbox event log, kept open across calls. At most one event per
+# cooldown window, so each is flushed as a whole line right away.
 def _write_event(payload: Dict[str, Any]) -> None:
-    ts = int(time.time())
-    fn = _outbox() / f"action-{ts}.json"
-    with fn.open("w") as f:
-        json.dump(payload, f, separators=(",", ":"), ensure_ascii=False)
+    fh = _wolf_io.out_fh(OUT_LOG)
+    fh.write(json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode() + b"\n")
+    fh.flush()
 
 def act(ctx: Dict[str, Any]) -> float:
     """
@@ -66,6 +62,7 @@ def act(ctx: Dict[str, Any]) -> float:
     if now - last_ts < cooldown:
         return 0.0  # skip this tick (respect cooldown)
 
+    now_i = int(now)
     # Prepare parameters (optional hints ignored by bridge if unknown)
     if phase == "patrol":
         # Short arc to slide around corners (natural movement)
@@ -76,7 +73,7 @@ def act(ctx: Dict[str, Any]) -> float:
             "pattern": "arc_left",
             "radius": 2,          # blocks
             "duration_s": 2,      # seconds, tiny burst
-            "tick": int(now)
+            "tick": now_i
         }
         next_phase = "follow"
         next_cooldown = 2.0
@@ -87,7 +84,7 @@ def act(ctx: Dict[str, Any]) -> float:
             "action": "wolf_actions",
             "wolf_action": "follow",
             "target": "owner",
-            "tick": int(now)
+            "tick": now_i
         }
         # Occasionally insert a patrol jiggle next time
         next_phase = "patrol"
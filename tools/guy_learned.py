@@ -1,33 +1,41 @@
 #!/usr/bin/env python3
 # Prints what Guy has learned so far: ticks, epsilon/alpha, top Q-values (+ counts),
 # recent action histogram & avg rewards, next due windows, dream timing, and dominance warning.
-import json, time, pathlib, datetime
-from collections import Counter, defaultdict, deque
+import json, sys, time, datetime
+from pathlib import Path
+from collections import Counter, defaultdict
 
-STATE = pathlib.Path("data/state.json")
-LOG   = pathlib.Path("data/events.log")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for skills/_logtail.py
+from skills._logtail import TICK_MARK, iter_lines_reversed
+
+STATE = Path("data/state.json")
+LOG   = Path("data/events.log")
 WINDOW = 1000  # recent ticks to analyze
 
 def load_state():
-    if not STATE.exists():
-        return {}
     try:
-        return json.loads(STATE.read_text(encoding="utf-8"))
+        return json.loads(STATE.read_bytes())  # missing/corrupt -> {}
     except Exception:
         return {}
 
-def tail_ticks(path: pathlib.Path, max_items: int):
-    out = deque(maxlen=max_items)
-    if not path.exists(): return list(out)
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                e = json.loads(line)
-                if e.get("kind") == "tick":
-                    out.append(e)
-            except Exception:
-                pass
-    return list(out)
+TAIL_CHUNK = 64 * 1024  # bytes per backwards read
+
+def tail_ticks(path: Path, max_items: int):
+    """Last max_items tick events, oldest first; reads only as far back as needed."""
+    out = []
+    for line in iter_lines_reversed(path, TAIL_CHUNK):
+        if TICK_MARK not in line:
+            continue
+        try:
+            e = json.loads(line)
+        except Exception:
+            continue
+        if e.get("kind") == "tick":
+            out.append(e)
+            if len(out) >= max_items:
+                break
+    out.reverse()
+    return out
 
 def fmt_hms(seconds:int):
     h = seconds//3600; m=(seconds%3600)//60; s=seconds%60
@@ -43,14 +51,19 @@ def main():
 
     # Recent behavior window
     recent = tail_ticks(LOG, WINDOW)
-    cnt = Counter(ev.get("action") for ev in recent if ev.get("action"))
+    # One pass: counts and reward sums together (no second walk, no per-event re-lookup)
+    cnt = Counter()
     rew = defaultdict(float)
     for ev in recent:
         a = ev.get("action")
         if a:
-            try: rew[a] += float(ev.get("reward", 0.0))
-            except: pass
-    avg = {a: (rew[a]/cnt[a]) for a in cnt if cnt[a]}
+            cnt[a] += 1
+            r = ev.get("reward", 0.0)
+            if r.__class__ is not float:
+                try: r = float(r)
+                except: continue
+            rew[a] += r
+    avg = {a: (rew[a]/c) for a, c in cnt.items()}
 
     # Sorts
     top_q = sorted(q.items(), key=lambda kv: kv[1], reverse=True)
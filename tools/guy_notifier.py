@@ -18,6 +18,10 @@ def check_dependencies():
         print("Installing libnotify-bin for desktop notifications...")
         subprocess.run(['sudo', 'apt', 'install', '-y', 'libnotify-bin'])
 
+# Checked once, not per message
+SOUND = '/usr/share/sounds/freedesktop/stereo/message.oga'
+HAVE_SOUND = Path(SOUND).exists()
+
 def send_notification(title, message, urgency="normal", icon="dialog-information"):
     """Send desktop notification"""
     try:
@@ -34,29 +38,70 @@ def send_notification(title, message, urgency="normal", icon="dialog-information
             message
         ])
         
-        # Also play a sound if available
-        if Path('/usr/share/sounds/freedesktop/stereo/message.oga').exists():
-            subprocess.run(['paplay', '/usr/share/sounds/freedesktop/stereo/message.oga'], 
-                         capture_output=True)
+        # Also play a sound if available; fire-and-forget so the loop doesn't wait
+        # for playback to finish (finished players are reaped by later Popen calls)
+        if HAVE_SOUND:
+            subprocess.Popen(['paplay', SOUND],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except Exception as e:
         print(f"Notification error: {e}")
 
+# No inotify in the stdlib: instead, the outbox is only re-listed when its directory
+# mtime changes (a message landing by create/rename bumps it), plus a safety rescan
+# every RESCAN_SECS in case two changes shared one mtime tick.
+POLL_SECS = 0.5
+RESCAN_SECS = 30.0
+
+# data/.notifier_seen is append-only while running and compacted at startup and after
+# every SEEN_KEEP appends: names still in the outbox plus the newest SEEN_KEEP others.
+SEEN_KEEP = 2000
+
+def _msg_names(outbox):
+    try:
+        with os.scandir(outbox) as it:
+            return sorted(e.name for e in it if e.name.startswith('msg-') and e.name.endswith('.json'))
+    except FileNotFoundError:
+        return []
+
 def monitor_messages():
     """Monitor for new Guy messages"""
     outbox = Path('data/outbox')
     outbox.mkdir(parents=True, exist_ok=True)
     
-    # Track seen messages
-    seen_messages = set()
+    # Track seen messages (insertion-ordered, oldest first)
     state_file = Path('data/.notifier_seen')
     
-    # Load previously seen messages
-    if state_file.exists():
-        seen_messages = set(state_file.read_text().strip().split('\n'))
+    # Load previously seen messages (one name per line)
+    raw = state_file.read_text() if state_file.exists() else ''
+    seen_messages = dict.fromkeys(filter(None, raw.split('\n')))
+    seen_fh = None
+    limit = 0
     
-    # Initial scan
-    for msg_file in outbox.glob('msg-*.json'):
-        seen_messages.add(msg_file.name)
+    def compact(current):
+        # Rewrite the file atomically with what can still matter, then append to it
+        nonlocal seen_messages, seen_fh, limit
+        in_box = set(current)
+        old = [n for n in seen_messages if n not in in_box][-SEEN_KEEP:]
+        seen_messages = dict.fromkeys(old + current)
+        if seen_fh is not None:
+            seen_fh.close()
+        tmp = state_file.with_name(state_file.name + '.tmp')
+        tmp.write_text(''.join(n + '\n' for n in seen_messages))
+        tmp.replace(state_file)
+        seen_fh = state_file.open('a')
+        limit = len(seen_messages) + SEEN_KEEP
+    
+    # Append-only between compactions: each newly seen name costs one short write,
+    # instead of rewriting the whole file per message
+    def mark_seen(names):
+        seen_messages.update(dict.fromkeys(names))
+        seen_fh.write(''.join(n + '\n' for n in names))
+        seen_fh.flush()
+        if len(seen_messages) >= limit:
+            compact(_msg_names(outbox))
+    
+    # Initial scan: everything already in the outbox counts as seen
+    compact(_msg_names(outbox))
     
     print(f"🔔 Guy Notifier Active")
     print(f"📂 Monitoring: {outbox.absolute()}")
@@ -64,11 +109,25 @@ def monitor_messages():
     print("=" * 50)
     print("Waiting for new messages from Guy...")
     
+    last_mtime = None
+    last_scan = 0.0
     try:
         while True:
+            # Skip the directory listing while nothing in the outbox changed
+            try:
+                mtime = os.stat(outbox).st_mtime_ns
+            except OSError:
+                mtime = None
+            now = time.monotonic()
+            if mtime == last_mtime and now - last_scan < RESCAN_SECS:
+                time.sleep(POLL_SECS)
+                continue
+            last_mtime, last_scan = mtime, now
+
             # Check for new messages
-            for msg_file in sorted(outbox.glob('msg-*.json')):
-                if msg_file.name not in seen_messages:
+            for name in _msg_names(outbox):
+                if name not in seen_messages:
+                    msg_file = outbox / name
                     try:
                         # Read the message
                         data = json.loads(msg_file.read_text())
@@ -102,28 +161,29 @@ def monitor_messages():
                         title = f"🤖 Guy Message [{time_str}]"
                         send_notification(title, content, urgency, icon)
                         
-                        # Console output
-                        print(f"\n{'='*50}")
-                        print(f"⚡ NEW MESSAGE from Guy [{time_str}]")
-                        print(f"Type: {msg_type}")
-                        print(f"Content: {content[:500]}")
-                        print(f"File: {msg_file.name}")
-                        print(f"{'='*50}")
+                        # Console output: one banner, one write
+                        sys.stdout.write(
+                            f"\n{'='*50}\n"
+                            f"⚡ NEW MESSAGE from Guy [{time_str}]\n"
+                            f"Type: {msg_type}\n"
+                            f"Content: {content[:500]}\n"
+                            f"File: {msg_file.name}\n"
+                            f"{'='*50}\n"
+                        )
+                        sys.stdout.flush()
                         
                         # Mark as seen
-                        seen_messages.add(msg_file.name)
-                        
-                        # Save state
-                        state_file.write_text('\n'.join(seen_messages))
+                        mark_seen([name])
                         
                     except Exception as e:
                         print(f"Error reading {msg_file}: {e}")
-                        seen_messages.add(msg_file.name)
+                        mark_seen([name])
             
             # Small delay to prevent CPU spinning
-            time.sleep(0.5)
+            time.sleep(POLL_SECS)
             
     except KeyboardInterrupt:
+        seen_fh.close()
         print("\n\n✋ Notifier stopped")
         sys.exit(0)
 
@@ -1,72 +1,174 @@
 from pathlib import Path
-import json, glob, os, time
+import heapq, json, os, re, time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 OUTBOX = Path("data/outbox")
 INBOX  = Path("data/inbox.txt")
 STATEF = Path("data/.reward_consumer_state.json")
+WORK_MAX = 2000      # newest fresh files parsed per run
+EVENTS_LOG = OUTBOX / "events.jsonl"    # append-only event stream, one object per line
+EVENTS_MAX_BYTES = 4 * 1024 * 1024      # unread backlog beyond this is skipped
+POOL_MIN_FILES = 64  # below this, thread start-up costs more than it overlaps
+POOL_WORKERS = min(32, (os.cpu_count() or 4) * 4)
 
 def _load_state():
     try:
-        return json.loads(STATEF.read_text(encoding="utf-8"))
+        return json.loads(STATEF.read_bytes())
     except Exception:
-        return {"last_mtime": 0.0, "last_run": 0.0}
+        return {"last_mtime_ns": 0, "last_run": 0.0}
+
+def _watermark_ns(s):
+    """Integer-ns watermark; exact, unlike float seconds near the same mtime tick."""
+    ns = s.get("last_mtime_ns")
+    if ns is not None:
+        return int(ns)
+    # Legacy float seconds: round up 1 µs so float error can't re-admit the file the
+    # watermark was taken from.
+    legacy = float(s.get("last_mtime", 0.0))
+    return int(legacy * 1e9) + 1000 if legacy > 0 else 0
 
 def _save_state(s):
     STATEF.parent.mkdir(parents=True, exist_ok=True)
-    STATEF.write_text(json.dumps(s, ensure_ascii=False, indent=2), encoding="utf-8")
-
-def _flatten(d, p=""):
-    if isinstance(d, dict):
-        for k,v in d.items():
-            yield from _flatten(v, f"{p}.{k}" if p else k)
-    elif isinstance(d, list):
-        for i,v in enumerate(d):
-            yield from _flatten(v, f"{p}[{i}]")
-    else:
-        yield p, d
+    # tmp + rename: a crash mid-write must not leave torn JSON, which _load_state would
+    # treat as a reset watermark and re-reward the whole outbox
+    tmp = STATEF.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(s, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, STATEF)
+
+# Leaf keys whose scalar values are counted as labels
+_INTERESTING = frozenset({"action","subtype","wolf_action","command","cmd","name","type"})
+_SCALARS = (str, int, float, bool)
+_POS = frozenset({"guard","follow","patrol","attack"})
+_NEG = frozenset({"howl"})  # keep 'idle' neutral for now
+# Byte-level check for an interesting key (also as the last segment of a dotted key).
+# Only trusted on files without backslashes, where no key can hide behind an escape.
+_KEY_RE = re.compile(rb'"(?:[^"\\]*\.)?(?:action|subtype|wolf_action|command|cmd|name|type)"\s*:')
 
-def _collect_labels(path):
-    labels = Counter()
+def _count_labels(data, labels):
+    """Count the scalar labels under interesting keys, in document order."""
+    if data.__class__ is not dict:
+        _walk_labels(None, data, labels)
+        return
+    # Every outbox producer (communicate, conversation_ai, the wolf events) writes one
+    # object with mostly scalar values: handle its top level inline, walk only the
+    # nested containers.
+    for k, v in data.items():
+        if v.__class__ is dict or v.__class__ is list:
+            _walk_labels(k if "." not in k else k.rsplit(".", 1)[-1], v, labels)
+        elif v is not None and (k in _INTERESTING or ("." in k and k.rsplit(".", 1)[-1] in _INTERESTING)):
+            labels[str(v)] += 1
+
+def _walk_labels(key, data, labels):
+    """Iterative walk that carries only each value's leaf key (the last dotted segment,
+    as the old "a.b[0].c" path strings had it); list items carry none. Children are
+    pushed reversed so labels are counted in document order."""
+    stack = [(key, data)]
+    pop, push = stack.pop, stack.extend
+    while stack:
+        key, v = pop()
+        if isinstance(v, dict):
+            push((k if "." not in k else k.rsplit(".", 1)[-1], vv) for k, vv in reversed(v.items()))
+        elif isinstance(v, list):
+            push((None, vv) for vv in reversed(v))
+        elif key in _INTERESTING and isinstance(v, _SCALARS):
+            labels[str(v)] += 1
+
+def _read_doc(path):
+    """Parsed JSON of path, or None when unreadable/invalid or holding no interesting key."""
     try:
-        with open(path, "r", encoding="utf-8", errors="replace") as fh:
-            data = json.load(fh)
+        # One binary read and one decode; no text-mode wrapper around the file
+        with open(path, "rb") as fh:
+            buf = fh.read()
+        if b"\\" not in buf and not _KEY_RE.search(buf):
+            return None  # no interesting key anywhere: skip the parse
+        return json.loads(buf.decode("utf-8", "replace"))
     except Exception:
-        return labels
-    for k,v in _flatten(data):
-        leaf = k.rsplit(".",1)[-1]
-        if leaf in {"action","subtype","wolf_action","command","cmd","name","type"}:
-            if isinstance(v, (str,int,float,bool)):
-                labels[str(v)] += 1
-    return labels
+        return None
+
+def _collect_labels(path, out):
+    """Count path's labels straight into out (no per-file Counter)."""
+    data = _read_doc(path)
+    if data is not None:
+        _count_labels(data, out)
+
+def _read_events(s, out):
+    """Count labels of EVENTS_LOG lines appended since the last run; returns how many
+    records were read. The (inode, offset) cursor lives in the state: a new inode or a
+    shorter file restarts from the top, and a trailing partial line is left for later."""
+    try:
+        fh = open(EVENTS_LOG, "rb")
+    except FileNotFoundError:
+        return 0
+    with fh:
+        st = os.fstat(fh.fileno())
+        off = int(s.get("events_off", 0))
+        if s.get("events_ino") != st.st_ino or off > st.st_size:
+            off = 0
+        trimmed = st.st_size - off > EVENTS_MAX_BYTES
+        if trimmed:
+            off = st.st_size - EVENTS_MAX_BYTES  # no fallback spamming: newest backlog only
+        fh.seek(off)
+        buf = fh.read(st.st_size - off)
+    end = buf.rfind(b"\n") + 1
+    s["events_ino"], s["events_off"] = st.st_ino, off + end
+    body = buf[:end]
+    if trimmed:
+        body = body[body.find(b"\n") + 1:]  # first line was cut by the trim
+    n = 0
+    for line in body.split(b"\n"):
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
+        except Exception:
+            continue
+        _count_labels(data, out)
+        n += 1
+    return n
 
 def main():
     s = _load_state()
     OUTBOX.mkdir(parents=True, exist_ok=True)
-    files = sorted(glob.glob(str(OUTBOX/"*.json")), key=os.path.getmtime, reverse=True)
+    # One scandir pass (DirEntry caches its stat); (mtime, path) pairs carry the mtime
+    # through filter, selection and work. Dotfiles are skipped, as the old *.json glob did.
+    with os.scandir(OUTBOX) as it:
+        entries = [(e.stat().st_mtime_ns, e.path) for e in it
+                   if e.name.endswith(".json") and not e.name.startswith(".")]
 
-    watermark = float(s.get("last_mtime", 0.0))
-    fresh = [f for f in files if os.path.getmtime(f) > watermark]
-    had_fresh = bool(fresh)
-    work = fresh[:2000]  # only reward on fresh items; no fallback spamming
+    watermark = _watermark_ns(s)
+    # only reward on fresh items; no fallback spamming. nlargest keeps a WORK_MAX-item heap
+    # instead of sorting the whole directory; it returns newest first, like the sort did.
+    work = heapq.nlargest(WORK_MAX, (e for e in entries if e[0] > watermark))
+    had_fresh = bool(work)
+    newest_ns = work[0][0] if work else watermark  # newest first
 
+    # File reads release the GIL, so a thread pool overlaps them on big batches; the
+    # workers only read+parse and every label is counted into agg on this thread.
+    # map() yields in submission order, which keeps agg's order (and top-6 ties) stable.
     agg = Counter()
-    newest_mtime = watermark
-    for f in work:
-        m = os.path.getmtime(f)
-        if m > newest_mtime:
-            newest_mtime = m
-        agg.update(_collect_labels(f))
-
-    pos_keys = {"guard","follow","patrol","attack"}
-    neg_keys = {"howl"}  # keep 'idle' neutral for now
-    pos = sum(agg[k] for k in pos_keys)
-    neg = sum(agg[k] for k in neg_keys)
+    paths = [f for _, f in work]
+    if len(paths) >= POOL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=POOL_WORKERS) as ex:
+            for data in ex.map(_read_doc, paths):
+                if data is not None:
+                    _count_labels(data, agg)
+    else:
+        for f in paths:
+            _collect_labels(f, agg)
+
+    # Skills that stream their events (the wolf skills) append to one JSONL instead
+    n_events = _read_events(s, agg)
+    had_fresh = had_fresh or n_events > 0
+
+    pos = sum(agg[k] for k in _POS)
+    neg = sum(agg[k] for k in _NEG)
 
     lines = []
     ts = time.strftime("%Y-%m-%d %H:%M:%S")
-    top6 = dict(agg.most_common(6))
-    lines.append(f"note consumer: {ts} scanned={len(work)} fresh={had_fresh} counts={{pos:{pos}, neg:{neg}}} top={top6}")
+    # Formatted like the repr of dict(most_common(6)) without building that dict
+    top6 = ", ".join(f"{k!r}: {c}" for k, c in agg.most_common(6))
+    lines.append(f"note consumer: {ts} scanned={len(work)} events={n_events} fresh={had_fresh} counts={{pos:{pos}, neg:{neg}}} top={{{top6}}}")
 
     rewards = []
     if had_fresh and pos > 0:
@@ -75,20 +177,25 @@ def main():
         rewards.append(("wolf_howl", -min(0.05, 0.005 * neg)))     # softer penalty
 
     if rewards:
+        reward_lines = [f"reward {a} {('+' if v>=0 else '')}{v:.3f}" for a,v in rewards]
+        # All lines in one O_APPEND write: atomic against main.py's concurrent reads
+        payload = "".join(L + "\n" for L in reward_lines).encode("utf-8")
         INBOX.parent.mkdir(parents=True, exist_ok=True)
-        with open(INBOX, "a", encoding="utf-8") as f:
-            for act, val in rewards:
-                sign = "+" if val >= 0 else ""
-                f.write(f"reward {act} {sign}{val:.3f}\n")
-        lines += [f"reward {a} {('+' if v>=0 else '')}{v:.3f}" for a,v in rewards]
+        fd = os.open(INBOX, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        lines += reward_lines
 
     s["last_run"] = time.time()
     if had_fresh:
-        s["last_mtime"] = float(newest_mtime)
+        s["last_mtime_ns"] = newest_ns
+        s.pop("last_mtime", None)  # legacy float watermark, superseded
     _save_state(s)
 
     print("== reward_consumer ==")
-    print(f"scanned: {len(work)} files  pos:{pos} neg:{neg}  fresh:{had_fresh}")
+    print(f"scanned: {len(work)} files {n_events} events  pos:{pos} neg:{neg}  fresh:{had_fresh}")
     for L in lines:
         print("  " + L)
 